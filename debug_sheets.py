@@ -2,24 +2,35 @@
 """
 Diagnostic script to test Google Sheets connection
 """
-import os
-from dotenv import load_dotenv
-from src.clients.sheets_client import SheetsClient
+import gspread
+from src.clients.sheets_client import create_sheets_client_from_config
+from src.config.config import Config
 from rich.console import Console
 
 console = Console()
 
+def print_private_key_diagnostics(pk: str) -> None:
+    """Inspect private key shape without leaking secrets."""
+    has_escaped = "\\n" in pk
+    has_real_newlines = '\n' in pk
+    has_header = "-----BEGIN" in pk
+    has_footer = "END PRIVATE KEY-----" in pk
+    console.print("\n[cyan]🔎 Private Key Diagnostics:[/cyan]")
+    console.print(f"  length: {len(pk)} chars")
+    console.print(f"  starts_with_BEGIN: {'✅' if has_header else '❌'}  ends_with_END: {'✅' if has_footer else '❌'}")
+    console.print(f"  contains_escaped_\\n: {'✅' if has_escaped else '❌'}  contains_real_newlines: {'✅' if has_real_newlines else '❌'}")
+
 def main():
     console.print("[bold blue]🔍 Google Sheets Connection Diagnostic[/bold blue]")
     
-    # Load environment variables
-    load_dotenv()
+    # Load environment variables through the shared configuration
+    config = Config()
     
     # Get credentials from environment
-    sheets_id = os.getenv("GOOGLE_SHEETS_ID")
-    service_account_email = os.getenv("GOOGLE_SERVICE_ACCOUNT_EMAIL")
-    private_key = os.getenv("GOOGLE_PRIVATE_KEY")
-    credentials_path = os.getenv("GOOGLE_SHEETS_CREDENTIALS_PATH", "")
+    sheets_id = config.google_sheets_id
+    service_account_email = config.google_service_account_email
+    private_key = config.google_private_key
+    credentials_path = config.google_credentials_path
     
     console.print("\n[cyan]📋 Environment Variables Status:[/cyan]")
     console.print(f"  GOOGLE_SHEETS_ID: {'✅ Found' if sheets_id else '❌ Missing'}")
@@ -30,46 +41,45 @@ def main():
         console.print("\n[red]❌ Missing environment variables. Please check your .env file.[/red]")
         return
     
-    # Inspect private key shape without leaking secrets
-    if private_key:
-        pk = private_key
-        preview = (pk[:30] + "..." + pk[-30:]) if len(pk) > 70 else pk
-        has_escaped = "\\n" in pk
-        has_real_newlines = '\n' in pk
-        has_header = "-----BEGIN" in pk
-        has_footer = "END PRIVATE KEY-----" in pk
-        console.print("\n[cyan]🔎 Private Key Diagnostics:[/cyan]")
-        console.print(f"  length: {len(pk)} chars")
-        console.print(f"  starts_with_BEGIN: {'✅' if has_header else '❌'}  ends_with_END: {'✅' if has_footer else '❌'}")
-        console.print(f"  contains_escaped_\\n: {'✅' if has_escaped else '❌'}  contains_real_newlines: {'✅' if has_real_newlines else '❌'}")
-    else:
-        console.print("\n[yellow]⚠️ No GOOGLE_PRIVATE_KEY found; will rely on GOOGLE_SHEETS_CREDENTIALS_PATH if provided[/yellow]")
+    # Parse the key exactly once; the same credentials object is reused by the client
+    console.print("\n[cyan]🔐 Parsing service account credentials...[/cyan]")
+    try:
+        credentials = config.get_google_credentials()
+    except Exception as e:
+        console.print(f"[red]❌ Could not parse credentials: {str(e)}[/red]")
+        # Only a failed parse needs the raw string inspected
+        if not credentials_path:
+            print_private_key_diagnostics(private_key)
+        return
+    
+    console.print(f"  service_account: {credentials.service_account_email}")
+    console.print(f"  private_key_id: {credentials.signer.key_id or 'n/a'}")
+    console.print(f"  source: {'credentials file' if credentials_path else 'inline GOOGLE_PRIVATE_KEY'}")
 
     console.print("\n[cyan]🔑 Testing Google Sheets Authentication...[/cyan]")
     
     try:
-        # Initialize SheetsClient
-        sheets_client = SheetsClient(
-            sheets_id=sheets_id,
-            service_account_email=service_account_email,
-            private_key=private_key or "",
-            credentials_path=credentials_path
-        )
+        # Initialize SheetsClient with the already-parsed credentials
+        sheets_client = create_sheets_client_from_config(config)
         
         # Test basic operations
         console.print("[green]✅ Authentication successful![/green]")
         
-        # Get spreadsheet info
-        info = sheets_client.get_worksheet_info()
+        # Get spreadsheet info and the Batches A1 value together
+        try:
+            info = sheets_client.get_info_and_cells(["Batches!A1"])
+        except gspread.exceptions.APIError as api_error:
+            # The API rejects the range with a 400 when the Batches worksheet is missing
+            if api_error.code != 400:
+                raise
+            info = sheets_client.get_info_and_cells([])
         console.print(f"\n[bold green]📊 Spreadsheet Connected:[/bold green]")
         console.print(f"  Title: {info['title']}")
         console.print(f"  Worksheets: {info['worksheet_count']}")
         
-        # Test reading from Batches worksheet
-        try:
-            cell_value = sheets_client.read_cell("Batches", "A1")
-            console.print(f"  Batches A1: '{cell_value}'")
-        except Exception as e:
+        if "Batches!A1" in info["cells"]:
+            console.print(f"  Batches A1: '{info['cells']['Batches!A1']}'")
+        else:
             console.print(f"  [yellow]Note: Batches worksheet may not exist yet (normal)[/yellow]")
         
         console.print("\n[bold green]🎉 All tests passed! Google Sheets integration is working.[/bold green]")
@@ -9,11 +9,8 @@ from rich.console import Console
 from rich.panel import Panel
 from rich import print as rich_print
 
-# Import our clients and configuration
-from src.clients.sheets_client import SheetsClient
-from src.clients.apify_client import create_apify_client_from_env
-from src.app_logic.discovery_flow import DiscoveryFlow
-from src.config.config import Config
+# Clients, flows and configuration are imported inside the commands that use them,
+# so lightweight commands like `hello` don't pay for gspread/google-auth/apify imports
 
 # Initialize Typer app and Rich console
 app = typer.Typer(help="ColdOutreachPythonNoDB - Automated Cold Outreach Pipeline")
@@ -59,17 +56,12 @@ def test_sheets():
     ))
     
     try:
-        # Load configuration
-        config = Config()
-        sheets_config = config.get_google_sheets_config()
+        from src.clients.sheets_client import create_sheets_client_from_config
+        from src.config.config import Config
         
-        # Initialize SheetsClient with dependency injection
-        sheets_client = SheetsClient(
-            sheets_id=sheets_config["sheets_id"],
-            service_account_email=sheets_config["service_account_email"],
-            private_key=sheets_config["private_key"],
-            credentials_path=sheets_config.get("credentials_path", "")
-        )
+        # Load configuration and build the client from its cached credentials
+        config = Config()
+        sheets_client = create_sheets_client_from_config(config)
         
         # Test reading from Batches worksheet
         console.print("[cyan]📊 Testing read access to 'Batches' worksheet...[/cyan]")
@@ -139,17 +131,16 @@ def run_discovery(
 ):
     """Run lead discovery workflow (Phase 2)."""
     try:
+        from src.clients.sheets_client import create_sheets_client_from_config
+        from src.clients.apify_client import create_apify_client_from_env
+        from src.app_logic.discovery_flow import DiscoveryFlow
+        from src.config.config import Config
+        
         # Load configuration
         config = Config()
-        sheets_config = config.get_google_sheets_config()
         
         # Initialize clients with dependency injection
-        sheets_client = SheetsClient(
-            sheets_id=sheets_config["sheets_id"],
-            service_account_email=sheets_config["service_account_email"],
-            private_key=sheets_config["private_key"],
-            credentials_path=sheets_config.get("credentials_path", "")
-        )
+        sheets_client = create_sheets_client_from_config(config)
         
         apify_client = create_apify_client_from_env()
         
@@ -3,120 +3,164 @@ Script to process Apollo JSON dataset and upload to Google Sheets in template fo
 Uses the existing Apollo data without going through discovery flow again.
 """
 
-import json
+import os
 import sys
-from typing import List, Dict, Any
+import ijson
+import orjson
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Dict, Any, Iterable, Iterator, Tuple
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress
 
-from src.models.schemas import ApifyProspect
-from src.clients.sheets_client import SheetsClient
+from src.models.schemas import ApifyProspect, validate_prospect_batch
+from src.clients.sheets_client import create_sheets_client_from_config
 from src.config.config import Config
 
 console = Console()
 
-def load_apollo_dataset(file_path: str) -> List[Dict[str, Any]]:
-    """Load Apollo dataset from JSON file."""
+# Number of streamed records validated together in one pydantic-core call
+BATCH_SIZE = 1000
+
+# Files up to this size are parsed in one orjson call; larger ones are streamed
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+def load_apollo_dataset(file_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Load Apollo records from a JSON array file, yielding them one at a time.
+    
+    Files up to STREAM_THRESHOLD_BYTES are parsed in a single orjson call, which
+    is several times faster than incremental parsing. Larger files are streamed
+    with ijson so peak memory stays flat regardless of dataset size.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        console.print(f"[green]✅ Loaded {len(data)} records from {file_path}[/green]")
-        return data
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size <= STREAM_THRESHOLD_BYTES:
+                data = orjson.loads(f.read())
+                console.print(f"[green]✅ Loaded {len(data)} records from {file_path}[/green]")
+                yield from data
+            else:
+                console.print(f"[green]✅ Streaming records from {file_path}[/green]")
+                yield from ijson.items(f, 'item')
     except Exception as e:
         console.print(f"[red]❌ Error loading dataset: {str(e)}[/red]")
         raise
 
-def process_apollo_records(raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Process Apollo records into template format."""
+def _batched(records: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Group a stream of records into lists of at most `size` records."""
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _process_batch(batch: List[Dict[str, Any]], first_position: int) -> Tuple[List[List[Any]], int, List[str]]:
+    """
+    Validate one batch of raw records and convert it to template rows
+    (value lists in TEMPLATE_COLUMNS order).
+    
+    Kept at module level so it can run in a worker process; warnings are
+    returned as strings and printed by the parent.
+    
+    Returns:
+        Tuple of (template_rows, invalid_count, warnings)
+    """
+    # Skip records without email (invalid for outreach); the filter runs once per record
+    kept = [offset for offset, raw_record in enumerate(batch) if raw_record.get('email')]
+    
+    # Reference the raw record for template generation in the same shallow merge
+    # that builds the model input, instead of copying each record into itself
+    records = [{**batch[offset], "raw_data": batch[offset]} for offset in kept]
+    
+    # Validate the whole batch with the Pydantic model
+    prospects, failures = validate_prospect_batch(records)
+    warnings = [
+        f"Skipping record {first_position + kept[index]}: {'; '.join(messages)}"
+        for index, messages in failures.items()
+    ]
+    
+    # Convert to template rows already in worksheet column order
+    template_rows = ApifyProspect.bulk_to_template_rows(prospects)
+    invalid_count = len(batch) - len(template_rows)
+    
+    return template_rows, invalid_count, warnings
+
+def process_apollo_records(raw_data: Iterable[Dict[str, Any]],
+                           workers: int = 1) -> Tuple[List[List[Any]], int]:
+    """
+    Process Apollo records into template format.
+    
+    Records are validated in batches of BATCH_SIZE via validate_prospect_batch.
+    With more than one worker, batches are spread across a process pool; at most
+    two batches per worker are in flight so streaming input stays bounded, and
+    results are collected in input order.
+    
+    Args:
+        raw_data: Iterable of raw Apollo records
+        workers: Number of worker processes (the default 1 processes batches
+            inline; pickling batches out to workers and rows back has not been
+            shown to beat it)
+        
+    Returns:
+        Tuple of (template_data, total_records_seen)
+    """
     template_data = []
     invalid_count = 0
+    total_count = 0
     
-    with Progress() as progress:
-        task = progress.add_task("[cyan]Processing Apollo records...", total=len(raw_data))
+    def collect(result: Tuple[List[List[Any]], int, List[str]], batch_size: int) -> None:
+        nonlocal invalid_count
+        template_rows, batch_invalid, warnings = result
+        for warning in warnings:
+            console.print(f"[yellow]⚠️ {warning}[/yellow]")
+        template_data.extend(template_rows)
+        invalid_count += batch_invalid
+        progress.update(task, advance=batch_size)
+    
+    # Cap redraws at 2 Hz; the bar only advances once per batch anyway
+    with Progress(refresh_per_second=2) as progress:
+        # Total is unknown while streaming, so the bar is indeterminate
+        task = progress.add_task("[cyan]Processing Apollo records...", total=None)
         
-        for i, raw_record in enumerate(raw_data):
-            try:
-                # Skip records without email (invalid for outreach)
-                if not raw_record.get('email'):
-                    invalid_count += 1
-                    progress.update(task, advance=1)
-                    continue
-                
-                # Add raw data to record for template generation
-                raw_record["raw_data"] = raw_record.copy()
-                
-                # Validate with Pydantic model
-                prospect = ApifyProspect(**raw_record)
-                
-                # Convert to template format
-                template_row = prospect.to_template_row()
-                template_data.append(template_row)
-                
-            except Exception as e:
-                invalid_count += 1
-                console.print(f"[yellow]⚠️ Skipping record {i+1}: {str(e)}[/yellow]")
-            
-            progress.update(task, advance=1)
+        if workers <= 1:
+            for batch in _batched(raw_data, BATCH_SIZE):
+                collect(_process_batch(batch, total_count + 1), len(batch))
+                total_count += len(batch)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending: deque[Tuple[Future, int]] = deque()
+                for batch in _batched(raw_data, BATCH_SIZE):
+                    pending.append((executor.submit(_process_batch, batch, total_count + 1), len(batch)))
+                    total_count += len(batch)
+                    if len(pending) >= workers * 2:
+                        future, batch_size = pending.popleft()
+                        collect(future.result(), batch_size)
+                while pending:
+                    future, batch_size = pending.popleft()
+                    collect(future.result(), batch_size)
     
     console.print(
         f"[green]✅ Processing complete: {len(template_data)} valid records, "
         f"{invalid_count} invalid records[/green]"
     )
     
-    return template_data
+    return template_data, total_count
 
-def upload_to_sheets(template_data: List[Dict[str, Any]], config: Config) -> None:
-    """Upload template data to Google Sheets."""
+def upload_to_sheets(template_data: List[List[Any]], config: Config) -> None:
+    """Upload template rows (already in TEMPLATE_COLUMNS order) to Google Sheets."""
     console.print("[cyan]📊 Uploading data to Google Sheets...[/cyan]")
     
-    # Get Google Sheets configuration
-    sheets_config = config.get_google_sheets_config()
-    
-    # Initialize sheets client
-    sheets_client = SheetsClient(
-        sheets_id=sheets_config['sheets_id'],
-        service_account_email=sheets_config['service_account_email'],
-        private_key=sheets_config['private_key'],
-        credentials_path=sheets_config['credentials_path']
-    )
-    
-    # Template header row
-    header_row = [
-        "Full Name", "Last Name", "First Name", "Email", "Title", 
-        "Personal LinkedIn", "Company Name", "Company Website", 
-        "Company LinkedIn", "Personal Summary", "Company Background", 
-        "Recent Company News", "Key Offerings", "Customer Sentiment", 
-        "Company Summary", "Outreach Message"
-    ]
+    # Initialize sheets client from the config's cached credentials
+    sheets_client = create_sheets_client_from_config(config)
     
-    # Convert template data to rows
-    data_rows = []
-    for template_record in template_data:
-        row = [
-            template_record.get("Full Name", ""),
-            template_record.get("Last Name", ""),
-            template_record.get("First Name", ""),
-            template_record.get("Email", ""),
-            template_record.get("Title", ""),
-            template_record.get("Personal LinkedIn", ""),
-            template_record.get("Company Name", ""),
-            template_record.get("Company Website", ""),
-            template_record.get("Company LinkedIn", ""),
-            template_record.get("Personal Summary", ""),
-            template_record.get("Company Background", ""),
-            template_record.get("Recent Company News", ""),
-            template_record.get("Key Offerings", ""),
-            template_record.get("Customer Sentiment", ""),
-            template_record.get("Company Summary", ""),
-            template_record.get("Outreach Message", "")
-        ]
-        data_rows.append(row)
-    
-    # Upload to sheets
+    # Upload to sheets, replacing any rows left from a previous run
     try:
-        sheets_client.append_rows("Prospects_Template", data_rows, header_row)
-        console.print(f"[green]✅ Successfully uploaded {len(data_rows)} records to Google Sheets[/green]")
+        sheets_client.write_table("Prospects_Template", ApifyProspect.template_columns(), template_data)
+        console.print(f"[green]✅ Successfully uploaded {len(template_data)} records to Google Sheets[/green]")
     except Exception as e:
         console.print(f"[red]❌ Error uploading to sheets: {str(e)}[/red]")
         raise
@@ -141,8 +185,8 @@ def main():
         dataset_path = "dataset_apollo-io-scraper_2025-09-08_09-00-23-234.json"
         raw_data = load_apollo_dataset(dataset_path)
         
-        # Process records into template format
-        template_data = process_apollo_records(raw_data)
+        # Process records into template format while streaming them from disk
+        template_data, total_records = process_apollo_records(raw_data)
         
         if not template_data:
             console.print("[red]❌ No valid records to upload[/red]")
@@ -155,9 +199,9 @@ def main():
         console.print(Panel(
             f"[bold green]Apollo Dataset Processing Complete! 🎉[/bold green]\n\n"
             f"📊 **Processing Results:**\n"
-            f"• Total records processed: {len(raw_data)}\n"
+            f"• Total records processed: {total_records}\n"
             f"• Valid template records: {len(template_data)}\n"
-            f"• Success rate: {(len(template_data)/len(raw_data)*100):.1f}%\n\n"
+            f"• Success rate: {(len(template_data)/total_records*100):.1f}%\n\n"
             f"💾 **Google Sheets Updates:**\n"
             f"• Sheet: Prospects_Template\n"
             f"• Records uploaded: {len(template_data)}\n"
@@ -4,18 +4,30 @@ Implements the complete lead discovery workflow using Apify integration with dep
 """
 
 import uuid
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Dict, Any, List, Optional
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, TaskID
-from pydantic import ValidationError
+from rich.table import Table
 
 from ..clients.apify_client import ApifyClient
 from ..clients.sheets_client import SheetsClient
-from ..models.schemas import ApifyProspect, ProspectNormalized, CompanyNormalized
+from ..models.schemas import (
+    ApifyProspect, ProspectNormalized, CompanyNormalized, CompanyRow, PROSPECT_COLUMNS, COMPANY_COLUMNS,
+    new_row_ids, validate_prospect_batch, validate_prospect_batch_json
+)
 
 console = Console()
 
+# Records processed between progress bar updates
+PROGRESS_UPDATE_EVERY = 512
+
+# Invalid records listed individually in the validation summary
+MAX_REPORTED_FAILURES = 10
+
 
 class DiscoveryFlow:
     """
@@ -23,16 +35,27 @@ class DiscoveryFlow:
     Handles the complete pipeline from Apify data retrieval to Google Sheets normalization.
     """
     
-    def __init__(self, apify_client: ApifyClient, sheets_client: SheetsClient):
+    def __init__(self, apify_client: ApifyClient, sheets_client: SheetsClient, trust_input: bool = False,
+                 include_raw: bool = False):
         """
         Initialize DiscoveryFlow with injected dependencies.
         
         Args:
             apify_client: Configured ApifyClient for API interactions
             sheets_client: Configured SheetsClient for Google Sheets operations
+            trust_input: Build prospects with ApifyProspect.model_construct,
+                skipping schema validation entirely. Only enable once the
+                Apify payload shape is monitored for drift: malformed records
+                are no longer rejected and emails are not normalized.
+            include_raw: Attach each original Apify record as orjson-encoded
+                ``raw_data`` bytes for debugging (decode with
+                ApifyProspect.raw_fields). Off by default: the normalized
+                Prospects/Companies rows never read it.
         """
         self.apify_client = apify_client
         self.sheets_client = sheets_client
+        self.trust_input = trust_input
+        self.include_raw = include_raw
         
         console.print("[cyan]🔧 DiscoveryFlow initialized with dependency injection[/cyan]")
     
@@ -79,29 +102,30 @@ class DiscoveryFlow:
             
             # Step 3: Run Apify scraper and fetch data
             console.print("[cyan]🚀 Step 2: Running Apollo scraper and fetching data...[/cyan]")
-            raw_data = self.apify_client.run_actor_and_fetch_data(
+            run = self.apify_client.start_actor(
                 actor_input=actor_input,
                 total_records=total_records
             )
             
-            results["raw_records_fetched"] = len(raw_data)
+            # Prepare the worksheets while the scrape runs instead of after it
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                sheets_ready = executor.submit(self._prepare_worksheets)
+                raw_payload = self.apify_client.wait_and_fetch_bytes(run)
+                sheets_ready.result()
             
             # Step 4: Process records with validation and normalization
-            console.print(f"[cyan]🔄 Step 3: Processing {len(raw_data)} records with validation...[/cyan]")
+            console.print("[cyan]🔄 Step 3: Processing records with validation...[/cyan]")
             
             prospects_data, companies_data = self._process_records_with_progress(
-                raw_data, results
+                raw_payload, results
             )
             
             # Step 5: Upsert data to Google Sheets
             console.print("[cyan]📊 Step 4: Upserting data to Google Sheets...[/cyan]")
             
-            if prospects_data:
-                prospects_inserted = self._upsert_prospects(prospects_data)
+            if prospects_data or companies_data:
+                prospects_inserted, companies_inserted = self._upsert_to_sheets(prospects_data, companies_data)
                 results["prospects_inserted"] = prospects_inserted
-            
-            if companies_data:
-                companies_inserted = self._upsert_companies(companies_data)
                 results["companies_inserted"] = companies_inserted
             
             # Success panel per UX flow guidelines
@@ -131,6 +155,11 @@ class DiscoveryFlow:
             
             raise
     
+    def _prepare_worksheets(self) -> None:
+        """Ensure the Prospects and Companies worksheets exist with header rows."""
+        self.sheets_client.ensure_headers("Prospects", list(PROSPECT_COLUMNS))
+        self.sheets_client.ensure_headers("Companies", list(COMPANY_COLUMNS))
+    
     def _format_targets(self, targets: Dict[str, Any]) -> str:
         """Format targets dictionary for display."""
         formatted = []
@@ -163,72 +192,94 @@ class DiscoveryFlow:
         console.print(f"[cyan]⚙️ Apollo scraper input: {actor_input}[/cyan]")
         return actor_input
     
-    def _process_records_with_progress(self, raw_data: List[Dict[str, Any]], 
-                                     results: Dict[str, Any]) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    def _process_records_with_progress(self, raw_payload: bytes, 
+                                     results: Dict[str, Any]) -> tuple[List[tuple], List[tuple]]:
         """
         Process raw records with rich progress bar and validation.
         
+        All records are validated in one batch call; invalid ones are reported
+        and skipped without failing the rest of the batch.
+        
         Args:
-            raw_data: Raw data from Apify
+            raw_payload: JSON array of raw records from Apify
             results: Results dictionary to update
             
         Returns:
-            Tuple of (prospects_data, companies_data)
+            Tuple of (prospects_data, companies_data) as worksheet row tuples
         """
         prospects_data = []
-        companies_data = []
-        companies_seen = set()  # Track unique companies
         
-        with Progress() as progress:
+        if self.include_raw or self.trust_input:
+            raw_data = orjson.loads(raw_payload)
+            
+            # Add raw data to each record for debugging, as compact orjson bytes
+            # rather than a dict copy (read it back via ApifyProspect.raw_fields)
+            if self.include_raw:
+                for raw_record in raw_data:
+                    raw_record["raw_data"] = orjson.dumps(raw_record)
+            
+            if self.trust_input:
+                # Trusted payloads skip the validator chain entirely
+                prospects, failures = [ApifyProspect.model_construct(**raw_record) for raw_record in raw_data], {}
+            else:
+                prospects, failures = validate_prospect_batch(raw_data)
+        else:
+            # Parse and validate the whole batch in one pydantic-core pass
+            prospects, failures = validate_prospect_batch_json(raw_payload)
+        
+        results["raw_records_fetched"] = len(prospects) + len(failures)
+        
+        if failures:
+            results["invalid_prospects"] += len(failures)
+            self._report_invalid_records(failures)
+        
+        companies_data: List[CompanyRow] = []
+        company_index: Dict[Any, int] = {}
+        
+        # Loop-local tallies, folded into results once after the loop
+        invalid = 0
+        errors: List[str] = []
+        
+        # One timestamp per batch and all row IDs generated up front
+        now = datetime.now().isoformat()
+        row_ids = new_row_ids(2 * len(prospects))
+        
+        # Single pass over the prospects. Each company is registered once under its
+        # company_key (Apollo organization_id, else normalized name and domain),
+        # and worksheet rows are emitted directly as column-ordered tuples.
+        with Progress(refresh_per_second=10) as progress:
             task = progress.add_task(
                 "[cyan]Processing prospects...", 
-                total=len(raw_data)
+                total=len(prospects)
             )
+            last_index = len(prospects) - 1
             
-            for i, raw_record in enumerate(raw_data):
+            for i, prospect in enumerate(prospects):
                 try:
-                    # Add raw data to record for debugging
-                    raw_record["raw_data"] = raw_record.copy()
-                    
-                    # Validate with Pydantic model
-                    prospect = ApifyProspect(**raw_record)
-                    
-                    # Convert to normalized formats
-                    prospect_row = prospect.to_prospect_row()
-                    company_row = prospect.to_company_row()
-                    
-                    # Use company name as unique identifier for deduplication
-                    company_key = company_row["name"].lower().strip()
-                    
-                    prospects_data.append(prospect_row)
-                    results["valid_prospects"] += 1
-                    
-                    # Add company if not seen before
-                    if company_key not in companies_seen:
-                        companies_data.append(company_row)
-                        companies_seen.add(company_key)
-                    
-                    # Update prospect with actual company ID
-                    prospect_row["company_id"] = company_row["id"]
+                    position = company_index.setdefault(prospect.company_key, len(companies_data))
+                    if position == len(companies_data):
+                        companies_data.append(prospect.to_company_tuple(row_ids[2 * i + 1], now))
                     
-                except ValidationError as ve:
-                    results["invalid_prospects"] += 1
-                    
-                    # Rich warning for invalid records per canon requirements
-                    console.print(
-                        f"[yellow]⚠️ Skipping invalid record {i+1}: "
-                        f"{self._format_validation_error(ve)}[/yellow]"
+                    # Point at the canonical company ID
+                    prospects_data.append(
+                        prospect.to_prospect_tuple(row_ids[2 * i], companies_data[position].id, now)
                     )
                     
                 except Exception as e:
-                    results["invalid_prospects"] += 1
-                    results["errors"].append(f"Record {i+1}: {str(e)}")
+                    invalid += 1
+                    errors.append(f"Prospect {i+1}: {str(e)}")
                     
                     console.print(
-                        f"[yellow]⚠️ Skipping record {i+1} due to error: {str(e)}[/yellow]"
+                        f"[yellow]⚠️ Skipping prospect {i+1} due to error: {str(e)}[/yellow]"
                     )
                 
-                progress.update(task, advance=1)
+                # Update the bar every PROGRESS_UPDATE_EVERY records rather than per record
+                if i % PROGRESS_UPDATE_EVERY == 0 or i == last_index:
+                    progress.update(task, completed=i + 1)
+        
+        results["valid_prospects"] += len(prospects_data)
+        results["invalid_prospects"] += invalid
+        results["errors"].extend(errors)
         
         console.print(
             f"[green]✅ Processing complete: {results['valid_prospects']} valid, "
@@ -237,101 +288,60 @@ class DiscoveryFlow:
         
         return prospects_data, companies_data
     
-    def _format_validation_error(self, error: ValidationError) -> str:
-        """Format ValidationError for display."""
-        errors = []
-        for err in error.errors():
-            field = " -> ".join(str(x) for x in err["loc"])
-            msg = err["msg"]
-            errors.append(f"{field}: {msg}")
-        return "; ".join(errors)
-    
-    def _upsert_prospects(self, prospects_data: List[Dict[str, Any]]) -> int:
+    def _report_invalid_records(self, failures: Dict[int, List[str]]) -> None:
         """
-        Upsert prospects data to Google Sheets.
+        Print one summary table for records rejected by validation.
         
         Args:
-            prospects_data: List of normalized prospect records
-            
-        Returns:
-            Number of records inserted
+            failures: Validation messages keyed by record index
         """
-        console.print(f"[cyan]📝 Upserting {len(prospects_data)} prospects to 'Prospects' sheet...[/cyan]")
+        # Rich warning for invalid records per canon requirements
+        table = Table(title=f"⚠️ Skipped {len(failures)} invalid records", title_style="yellow")
+        table.add_column("Record", justify="right", style="yellow")
+        table.add_column("Validation errors")
         
-        try:
-            # Prepare data for sheets insertion (convert to rows)
-            header_row = [
-                "id", "first_name", "last_name", "email", "company_id", 
-                "title", "linkedin_url", "phase", "created_at", "updated_at"
-            ]
-            
-            data_rows = []
-            for prospect in prospects_data:
-                row = [
-                    prospect["id"],
-                    prospect["first_name"],
-                    prospect["last_name"],
-                    prospect["email"],
-                    prospect["company_id"],
-                    prospect["title"],
-                    prospect["linkedin_url"],
-                    prospect["phase"],
-                    prospect["created_at"],
-                    prospect["updated_at"]
-                ]
-                data_rows.append(row)
-            
-            # Use sheets_client to append data
-            self.sheets_client.append_rows("Prospects", data_rows, header_row)
-            
-            console.print(f"[green]✅ Successfully inserted {len(data_rows)} prospects[/green]")
-            return len(data_rows)
-            
-        except Exception as e:
-            console.print(f"[red]❌ Failed to upsert prospects: {str(e)}[/red]")
-            raise
+        for index in sorted(failures)[:MAX_REPORTED_FAILURES]:
+            table.add_row(str(index + 1), "; ".join(failures[index]))
+        
+        console.print(table)
+        if len(failures) > MAX_REPORTED_FAILURES:
+            console.print(f"[yellow]…and {len(failures) - MAX_REPORTED_FAILURES} more[/yellow]")
     
-    def _upsert_companies(self, companies_data: List[Dict[str, Any]]) -> int:
+    def _upsert_to_sheets(self, prospects_data: List[tuple], 
+                          companies_data: List[tuple]) -> tuple[int, int]:
         """
-        Upsert companies data to Google Sheets.
+        Upsert prospects and companies to Google Sheets in one batch request.
         
         Args:
-            companies_data: List of normalized company records
+            prospects_data: Normalized prospect rows in PROSPECT_COLUMNS order
+            companies_data: Normalized company rows in COMPANY_COLUMNS order
             
         Returns:
-            Number of records inserted
+            Tuple of (prospects inserted, companies inserted)
         """
-        console.print(f"[cyan]🏢 Upserting {len(companies_data)} companies to 'Companies' sheet...[/cyan]")
+        console.print(
+            f"[cyan]📝 Upserting {len(prospects_data)} prospects to 'Prospects' and "
+            f"{len(companies_data)} companies to 'Companies' sheet...[/cyan]"
+        )
         
         try:
-            # Prepare data for sheets insertion (convert to rows)
-            header_row = [
-                "id", "name", "domain", "industry", "size", 
-                "location", "description", "created_at"
-            ]
-            
-            data_rows = []
-            for company in companies_data:
-                row = [
-                    company["id"],
-                    company["name"],
-                    company["domain"],
-                    company["industry"],
-                    company["size"],
-                    company["location"],
-                    company["description"],
-                    company["created_at"]
-                ]
-                data_rows.append(row)
+            sheet_rows = {}
+            if prospects_data:
+                sheet_rows["Prospects"] = (list(PROSPECT_COLUMNS), prospects_data)
+            if companies_data:
+                sheet_rows["Companies"] = (list(COMPANY_COLUMNS), companies_data)
             
-            # Use sheets_client to append data
-            self.sheets_client.append_rows("Companies", data_rows, header_row)
+            # Use sheets_client to append both worksheets in a single round trip
+            self.sheets_client.batch_append(sheet_rows)
             
-            console.print(f"[green]✅ Successfully inserted {len(data_rows)} companies[/green]")
-            return len(data_rows)
+            console.print(
+                f"[green]✅ Successfully inserted {len(prospects_data)} prospects "
+                f"and {len(companies_data)} companies[/green]"
+            )
+            return len(prospects_data), len(companies_data)
             
         except Exception as e:
-            console.print(f"[red]❌ Failed to upsert companies: {str(e)}[/red]")
+            console.print(f"[red]❌ Failed to upsert prospects and companies: {str(e)}[/red]")
             raise
     
     def _display_success_results(self, results: Dict[str, Any]) -> None:
@@ -5,15 +5,45 @@ Handles authentication, actor execution, and dataset retrieval from Apify platfo
 
 import os
 import time
-from typing import Dict, List, Any, Optional
+import orjson
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from apify_client import ApifyClient as ApifyClientSDK
 from rich.console import Console
 from rich.panel import Panel
-from urllib.parse import urlencode
+from urllib.parse import quote
 from dotenv import load_dotenv
 
 console = Console()
 
+APOLLO_PEOPLE_URL = "https://app.apollo.io/#/people"
+
+
+# Pre-rendered "name[]=" query prefixes for the Apollo search parameters
+_SIZE_PARAM = "organizationNumEmployeesRanges[]="
+_INDUSTRY_PARAM = "qOrganizationKeywordTags[]="
+_LOCATION_PARAM = "personLocations[]="
+_TITLE_PARAM = "personTitles[]="
+
+
+@lru_cache(maxsize=64)
+def _encode_apollo_url(company_size: Optional[str], industry: Optional[str],
+                       location: Optional[str], job_titles: Tuple[str, ...]) -> str:
+    """Build the percent-encoded Apollo people search URL for a set of targets."""
+    # Keep [] readable; encode spaces as %20 like the Apollo UI does
+    params = []
+    if company_size:
+        params.append(_SIZE_PARAM + quote(company_size, safe="[]"))
+    if industry:
+        params.append(_INDUSTRY_PARAM + quote(industry, safe="[]"))
+    if location:
+        params.append(_LOCATION_PARAM + quote(location, safe="[]"))
+    params.extend(_TITLE_PARAM + quote(title, safe="[]") for title in job_titles)
+    
+    if not params:
+        return APOLLO_PEOPLE_URL
+    return f"{APOLLO_PEOPLE_URL}?{'&'.join(params)}"
+
 
 class ApifyClient:
     """
@@ -36,7 +66,9 @@ class ApifyClient:
         self.api_token = api_token.strip()
         self.actor_id = actor_id.strip()
         self.max_retries = max_retries
-        self.client = ApifyClientSDK(self.api_token)
+        # One SDK client per ApifyClient: its HTTP session keeps connections alive
+        # across the actor start, run polling and dataset fetch
+        self.client = ApifyClientSDK(self.api_token, max_retries=self.max_retries)
         
         console.print(f"[cyan]📡 Apify client initialized with actor ID: {self.actor_id}[/cyan]")
     
@@ -55,6 +87,23 @@ class ApifyClient:
         Raises:
             Exception: If actor execution fails
         """
+        run = self.start_actor(actor_input, total_records)
+        return self.wait_and_fetch_data(run)
+    
+    def start_actor(self, actor_input: Dict[str, Any], total_records: int = 10) -> Dict[str, Any]:
+        """
+        Start the Apollo scraper actor without waiting for it to finish.
+        
+        Args:
+            actor_input: Input data for the scraper (must include 'url' and 'totalRecords')
+            total_records: Total number of records to fetch (max 50000)
+            
+        Returns:
+            Apify run object of the started run
+            
+        Raises:
+            Exception: If the actor cannot be started
+        """
         console.print(f"[cyan]🚀 Running Apollo scraper actor for {total_records} leads...[/cyan]")
         
         try:
@@ -63,17 +112,57 @@ class ApifyClient:
             
             console.print(f"[cyan]📤 Actor input: {run_input}[/cyan]")
             
-            # Run the actor and wait for completion
-            run = self.client.actor(self.actor_id).call(run_input=run_input)
-            console.print(f"[green]✅ Actor run completed: {run['id']}[/green]")
+            run = self.client.actor(self.actor_id).start(run_input=run_input)
+            console.print(f"[cyan]⏳ Actor run started: {run['id']}[/cyan]")
+            return run
+            
+        except Exception as e:
+            console.print(f"[red]❌ Actor execution failed: {str(e)}[/red]")
+            raise
+    
+    def wait_and_fetch_data(self, run: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Wait for a started actor run to finish and return its dataset items.
+        
+        Args:
+            run: Apify run object returned by start_actor
             
-            # Fetch results from the dataset
-            results = []
-            for item in self.client.dataset(run["defaultDatasetId"]).iterate_items():
-                results.append(item)
+        Returns:
+            List of lead data dictionaries
+            
+        Raises:
+            Exception: If the run does not succeed
+        """
+        # Parse the whole dataset payload in a single orjson call
+        results = orjson.loads(self.wait_and_fetch_bytes(run))
+        
+        console.print(f"[green]✅ Successfully fetched {len(results)} leads[/green]")
+        return results
+    
+    def wait_and_fetch_bytes(self, run: Dict[str, Any]) -> bytes:
+        """
+        Wait for a started actor run to finish and return its dataset as raw JSON.
+        
+        Args:
+            run: Apify run object returned by start_actor
+            
+        Returns:
+            JSON array of lead records, undecoded
+            
+        Raises:
+            Exception: If the run does not succeed
+        """
+        try:
+            run_id = run["id"]
+            run = self.client.run(run_id).wait_for_finish()
+            if run is None:
+                raise Exception(f"Actor run {run_id} not found")
+            if run["status"] != "SUCCEEDED":
+                raise Exception(f"Actor run {run['id']} finished with status {run['status']}")
+            console.print(f"[green]✅ Actor run completed: {run['id']}[/green]")
             
-            console.print(f"[green]✅ Successfully fetched {len(results)} leads[/green]")
-            return results
+            # Fetch the whole dataset as one JSON payload
+            return self.client.dataset(run["defaultDatasetId"]).get_items_as_bytes(item_format="json")
             
         except Exception as e:
             console.print(f"[red]❌ Actor execution failed: {str(e)}[/red]")
@@ -116,8 +205,6 @@ class ApifyClient:
         Returns:
             Properly formatted Apollo search URL
         """
-        base_url = "https://app.apollo.io/#/people"
-        
         # Extract search parameters from targets
         company_size = targets.get('company_size', '1-50')
         industry = targets.get('industry', 'Technology')
@@ -125,30 +212,13 @@ class ApifyClient:
         job_titles = targets.get('job_titles', ['CEO', 'Founder', 'CTO'])
         
         # Build search URL with correct Apollo parameter names from docs
-        url_params = []
-        
-        # Company size range - using organizationNumEmployeesRanges[]
-        if company_size:
-            url_params.append(f"organizationNumEmployeesRanges[]={company_size}")
-        
-        # Industry keywords - using qOrganizationKeywordTags[]
-        if industry:
-            url_params.append(f"qOrganizationKeywordTags[]={industry}")
-        
-        # Geographic locations - using personLocations[]
-        if location:
-            url_params.append(f"personLocations[]={location}")
-        
-        # Job titles - using personTitles[] (one parameter per title)
-        if job_titles:
-            for title in job_titles:
-                url_params.append(f"personTitles[]={title}")
-        
-        # Construct final URL
-        if url_params:
-            search_url = f"{base_url}?{'&'.join(url_params)}"
-        else:
-            search_url = base_url
+        # (one personTitles[] parameter per title)
+        search_url = _encode_apollo_url(
+            company_size or None,
+            industry or None,
+            location or None,
+            tuple(job_titles or ()),
+        )
         
         console.print(f"[cyan]🔗 Built Apollo search URL: {search_url}[/cyan]")
         return search_url
@@ -161,12 +231,9 @@ class ApifyClient:
             True if connection is successful, False otherwise
         """
         try:
-            url = f"{self.client.base_url}/users/me"
-            response = self.client.http_client.get(url)
-            response.raise_for_status()
-            
-            user_data = response.json()
-            username = user_data['data'].get('username', 'Unknown')
+            # Goes through the SDK's pooled HTTP client and retry handling
+            user_data = self.client.user("me").get() or {}
+            username = user_data.get('username', 'Unknown')
             
             console.print(Panel(
                 f"[bold green]Apify API Connection Successful! 🎉[/bold green]\n\n"
@@ -179,7 +246,7 @@ class ApifyClient:
             
             return True
             
-        except requests.exceptions.RequestException as e:
+        except Exception as e:
             console.print(Panel(
                 f"[bold red]Apify API Connection Failed[/bold red]\n\n"
                 f"❌ Error: {str(e)}\n\n"
@@ -4,22 +4,86 @@ Handles all Google Sheets operations with service account authentication.
 """
 
 import os
-import json
+import threading
+import time
 import gspread
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from operator import itemgetter
+from gspread.utils import rowcol_to_a1
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
 from google.oauth2.service_account import Credentials
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
 from rich.panel import Panel
 
+from ..config.config import Config
+
 console = Console()
 
+# Google's default Sheets write quota is 60 requests per minute per user
+SHEETS_WRITES_PER_MINUTE = 60
+
+
+class _QuotaRetry(Retry):
+    """
+    Retry policy that resends throttled requests of any verb.
+    
+    A 429 means the request was rejected before it was applied, so even
+    non-idempotent POSTs (values.append, batchUpdate appendCells) are safe to
+    resend. Server errors and read timeouts may arrive after the write already
+    happened, so those are only retried for idempotent verbs (urllib3's
+    default allowed_methods) to avoid appending rows twice.
+    """
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code == 429:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class _WriteRateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that paces write (non-GET) requests with a token bucket.
+    
+    Bursts of up to writes_per_minute requests go out immediately; after
+    that, writes are spaced so the per-minute quota isn't exceeded and the
+    API doesn't answer with 429s. Reads are never delayed, and retries happen
+    inside the adapter so they are not counted twice.
+    """
+    
+    def __init__(self, writes_per_minute: int, **kwargs):
+        super().__init__(**kwargs)
+        self._capacity = float(writes_per_minute)
+        self._rate = writes_per_minute / 60.0  # Tokens per second
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def send(self, request, **kwargs):
+        if request.method != "GET":
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                # Take a token; a negative balance reserves a future slot
+                self._tokens -= 1
+                wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            if wait > 0:
+                time.sleep(wait)
+        return super().send(request, **kwargs)
+
 class SheetsClient:
     """
     Google Sheets client with service account authentication.
     Provides methods for worksheet operations following canon configuration.
     """
     
-    def __init__(self, sheets_id: str, service_account_email: str, private_key: str, credentials_path: str = ""):
+    def __init__(self, sheets_id: str, service_account_email: str, private_key: str, credentials_path: str = "",
+                 credentials: Optional[Credentials] = None, max_retries: int = 6, verbose: bool = False,
+                 writes_per_minute: int = SHEETS_WRITES_PER_MINUTE):
         """
         Initialize Google Sheets client with service account credentials.
         
@@ -27,47 +91,45 @@ class SheetsClient:
             sheets_id: Google Sheets document ID
             service_account_email: Service account email address
             private_key: Service account private key (PEM format)
+            credentials_path: Optional path to a service account JSON key file
+            credentials: Optional pre-built credentials; when given the key
+                material above is not parsed again
+            max_retries: Maximum retry attempts for rate-limited (429)
+                requests, and for failed (5xx) idempotent requests
+            verbose: Print a message for every single-row operation and
+                worksheet lookup; batch summaries and errors are always printed
+            writes_per_minute: Client-side cap on Sheets write requests, kept
+                at or below the project's quota to avoid 429 backoff stalls
         """
         self.sheets_id = sheets_id
+        self.max_retries = max_retries
+        self.verbose = verbose
         self.gc = None
         self.spreadsheet = None
+        self.session = None
+        
+        # Per-client caches of resolved worksheets and their header rows,
+        # so repeated operations don't re-read sheet metadata
+        self._worksheets: Dict[str, gspread.Worksheet] = {}
+        self._headers: Dict[str, List[str]] = {}
+        
+        # Requests queued inside a batch() block; None when not batching
+        self._batch: Optional[List[Dict[str, Any]]] = None
+        
+        # Header rows queued in the current batch; cached once the batch is sent
+        self._pending_headers: Dict[str, List[str]] = {}
         
         try:
-            # Set up scopes for Sheets and Drive access
-            scopes = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-
-            # Prefer JSON credentials file if provided
-            if credentials_path:
-                credentials = Credentials.from_service_account_file(credentials_path, scopes=scopes)
-            else:
-                # Clean and format private key properly
-                cleaned_private_key = private_key.strip()
-                # Strip surrounding quotes if present
-                if (cleaned_private_key.startswith('"') and cleaned_private_key.endswith('"')) or \
-                   (cleaned_private_key.startswith("'") and cleaned_private_key.endswith("'")):
-                    cleaned_private_key = cleaned_private_key[1:-1]
-                # Normalize Windows newlines and escaped sequences
-                cleaned_private_key = cleaned_private_key.replace('\r\n', '\n').replace('\r', '\n')
-                if '\\n' in cleaned_private_key:
-                    cleaned_private_key = cleaned_private_key.replace('\\n', '\n')
-
-                # Create service account credentials from provided pieces
-                service_account_info = {
-                    "type": "service_account",
-                    "private_key": cleaned_private_key,
-                    "client_email": service_account_email,
-                    "token_uri": "https://oauth2.googleapis.com/token"
-                }
-
-                credentials = Credentials.from_service_account_info(
-                    service_account_info, scopes=scopes
+            if credentials is None:
+                credentials = Config.build_google_credentials(
+                    service_account_email, private_key, credentials_path
                 )
             
+            # One pooled keep-alive session serves every request this client makes
+            self.session = self._build_session(credentials, max_retries, writes_per_minute)
+            
             # Initialize gspread client
-            self.gc = gspread.authorize(credentials)
+            self.gc = gspread.authorize(credentials, session=self.session)
             
             # Open the spreadsheet
             self.spreadsheet = self.gc.open_by_key(sheets_id)
@@ -91,6 +153,36 @@ class SheetsClient:
             ))
             raise
     
+    @staticmethod
+    def _build_session(credentials: Credentials, max_retries: int,
+                       writes_per_minute: int = SHEETS_WRITES_PER_MINUTE) -> AuthorizedSession:
+        """
+        Create an authorized HTTP session with connection pooling and retries.
+        
+        Reusing one session keeps the TLS connection to sheets.googleapis.com
+        alive between calls instead of handshaking per request. Rate-limit
+        errors (and server errors on idempotent requests) are retried at the
+        transport layer with jittered exponential backoff, honouring
+        Retry-After, so a quota blip doesn't abort an upload. Writes to the
+        Sheets API are additionally paced to writes_per_minute so bursts don't
+        run into the quota in the first place.
+        """
+        retry = _QuotaRetry(
+            total=max_retries,
+            backoff_factor=0.5,
+            backoff_jitter=1.0,  # Spread concurrent retries (e.g. bulk_write chunks) apart
+            backoff_max=60,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+            raise_on_status=False  # Let gspread raise APIError on the final response
+        )
+        session = AuthorizedSession(credentials)
+        session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+        session.mount("https://sheets.googleapis.com/", _WriteRateLimitedAdapter(
+            writes_per_minute, pool_connections=10, pool_maxsize=20, max_retries=retry
+        ))
+        return session
+    
     def get_worksheet(self, sheet_name: str):
         """
         Get a worksheet by name.
@@ -101,16 +193,41 @@ class SheetsClient:
         Returns:
             gspread.Worksheet object
         """
+        worksheet = self._worksheets.get(sheet_name)
+        if worksheet is not None:
+            return worksheet
+        
         try:
-            return self.spreadsheet.worksheet(sheet_name)
+            worksheet = self.spreadsheet.worksheet(sheet_name)
         except gspread.exceptions.WorksheetNotFound:
-            console.print(Panel(
-                f"[bold yellow]Creating new worksheet: {sheet_name}[/bold yellow]\n"
-                f"📝 Worksheet will be created automatically",
-                title="📋 New Worksheet",
-                border_style="yellow"
-            ))
-            return self.spreadsheet.add_worksheet(title=sheet_name, rows=1000, cols=20)
+            if self.verbose:
+                console.print(Panel(
+                    f"[bold yellow]Creating new worksheet: {sheet_name}[/bold yellow]\n"
+                    f"📝 Worksheet will be created automatically",
+                    title="📋 New Worksheet",
+                    border_style="yellow"
+                ))
+            worksheet = self.spreadsheet.add_worksheet(title=sheet_name, rows=1000, cols=20)
+            self._headers[sheet_name] = []
+        
+        self._worksheets[sheet_name] = worksheet
+        return worksheet
+    
+    def _get_headers(self, sheet_name: str) -> List[str]:
+        """
+        Get a worksheet's header row, reading it from the API only once.
+        
+        Args:
+            sheet_name: Name of the worksheet
+            
+        Returns:
+            Values of the first row (empty list if the worksheet is empty)
+        """
+        headers = self._pending_headers.get(sheet_name) or self._headers.get(sheet_name)
+        if headers is None:
+            headers = self.get_worksheet(sheet_name).row_values(1)
+            self._headers[sheet_name] = headers
+        return headers
     
     def get_all_records(self, sheet_name: str) -> List[Dict[str, Any]]:
         """
@@ -125,6 +242,37 @@ class SheetsClient:
         worksheet = self.get_worksheet(sheet_name)
         return worksheet.get_all_records()
     
+    def batch_get_records(self, sheet_names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get all records from several worksheets with one values.batchGet request.
+        
+        Args:
+            sheet_names: Names of the worksheets to read
+            
+        Returns:
+            Mapping of worksheet name to rows as dictionaries keyed by the
+            worksheet's header row (short rows are padded with "")
+        """
+        if not sheet_names:
+            return {}
+        
+        ranges = [self._quote_sheet_name(name) for name in sheet_names]
+        value_ranges = self.spreadsheet.values_batch_get(
+            ranges, params={"valueRenderOption": "UNFORMATTED_VALUE"}
+        ).get("valueRanges", [])
+        
+        records: Dict[str, List[Dict[str, Any]]] = {}
+        for name, value_range in zip(sheet_names, value_ranges):
+            values = value_range.get("values") or [[]]
+            header_row = values[0]
+            self._headers[name] = [str(cell) for cell in header_row]
+            width = len(header_row)
+            records[name] = [
+                dict(zip(header_row, row + [""] * (width - len(row))))
+                for row in values[1:]
+            ]
+        return records
+    
     def append_rows(self, sheet_name: str, rows: List[List[Any]], header_row: Optional[List[str]] = None) -> None:
         """
         Append multiple rows to a worksheet, optionally ensuring headers exist.
@@ -138,18 +286,310 @@ class SheetsClient:
         
         # Check if we need to add headers
         if header_row:
-            try:
-                existing_headers = worksheet.row_values(1)
-                if not existing_headers or all(cell == "" for cell in existing_headers):
-                    # Add header row if worksheet is empty or first row is blank
+            self.ensure_headers(sheet_name, header_row)
+        
+        if rows and self._batch is not None:
+            self._batch.append(self._append_request(worksheet.id, rows))
+            if self.verbose:
+                console.print(f"[cyan]📥 Queued {len(rows)} rows for {sheet_name}[/cyan]")
+        elif rows:
+            worksheet.append_rows(rows)
+            if self.verbose:
+                console.print(f"[green]✅ Appended {len(rows)} rows to {sheet_name}[/green]")
+    
+    def ensure_headers(self, sheet_name: str, header_row: List[str]) -> None:
+        """
+        Make sure a worksheet exists and has a header row.
+        
+        Args:
+            sheet_name: Name of the worksheet
+            header_row: Header row to insert if the worksheet is empty or its first row is blank
+        """
+        worksheet = self.get_worksheet(sheet_name)
+        
+        try:
+            existing_headers = self._get_headers(sheet_name)
+            if not existing_headers or all(cell == "" for cell in existing_headers):
+                # Add header row if worksheet is empty or first row is blank
+                if self._batch is not None:
+                    self._batch.extend(self._header_requests(worksheet.id, header_row))
+                    self._pending_headers[sheet_name] = list(header_row)
+                else:
                     worksheet.insert_row(header_row, 1)
+                    self._headers[sheet_name] = list(header_row)
+                if self.verbose:
                     console.print(f"[cyan]📋 Added headers to {sheet_name}: {', '.join(header_row)}[/cyan]")
-            except Exception as e:
-                console.print(f"[yellow]⚠️ Could not check/add headers to {sheet_name}: {str(e)}[/yellow]")
+        except Exception as e:
+            console.print(f"[yellow]⚠️ Could not check/add headers to {sheet_name}: {str(e)}[/yellow]")
+    
+    def prepare_writer(self, sheet_name: str, header_row: List[str],
+                       batch_size: int = 500) -> Callable[[Iterable[Dict[str, Any]]], int]:
+        """
+        Resolve a worksheet's column order once and return a fast row writer.
         
-        if rows:
-            worksheet.append_rows(rows)
-            console.print(f"[green]✅ Appended {len(rows)} rows to {sheet_name}[/green]")
+        Headers are ensured up front; if the worksheet already has headers,
+        their order is used. The returned writer maps each dict to a row with a
+        precomputed itemgetter (columns missing from a dict, such as ones added
+        to the sheet by hand, are written as "") and appends rows with one
+        values.append per batch_size rows, or queues them inside batch().
+        
+        Args:
+            sheet_name: Name of the worksheet
+            header_row: Header row to create if the worksheet has none
+            batch_size: Rows sent per append request
+            
+        Returns:
+            writer(rows_as_dicts) -> number of rows written
+        """
+        self.ensure_headers(sheet_name, header_row)
+        worksheet = self.get_worksheet(sheet_name)
+        columns = tuple(self._get_headers(sheet_name))
+        getter = itemgetter(*columns)
+        if len(columns) == 1:
+            # itemgetter returns a bare value for a single key
+            getter = lambda row, _get=getter: (_get(row),)
+        
+        def to_values(row: Dict[str, Any]) -> List[Any]:
+            try:
+                return list(getter(row))
+            except KeyError:
+                # Slow path only for dicts that lack some sheet columns
+                return [row.get(column, "") for column in columns]
+        
+        def send(batch: List[List[Any]]) -> None:
+            if self._batch is not None:
+                self._batch.append(self._append_request(worksheet.id, batch))
+            else:
+                worksheet.append_rows(batch, value_input_option="RAW")
+        
+        def writer(rows: Iterable[Dict[str, Any]]) -> int:
+            written = 0
+            batch = []
+            for row in rows:
+                batch.append(to_values(row))
+                if len(batch) == batch_size:
+                    send(batch)
+                    written += len(batch)
+                    batch = []
+            if batch:
+                send(batch)
+                written += len(batch)
+            if self.verbose:
+                console.print(f"[green]✅ Appended {written} rows to {sheet_name}[/green]")
+            return written
+        
+        return writer
+    
+    def batch_append(self, sheet_rows: Dict[str, Tuple[List[str], List[List[Any]]]]) -> None:
+        """
+        Append rows to several worksheets in a single spreadsheets.batchUpdate.
+        
+        Header presence for every worksheet is checked with one values.batchGet;
+        missing headers are inserted at row 1 in the same batch as the appends.
+        
+        Args:
+            sheet_rows: Mapping of worksheet name to (header_row, rows)
+        """
+        if not sheet_rows:
+            return
+        
+        worksheets = {name: self.get_worksheet(name) for name in sheet_rows}
+        
+        # Fetch the first row of every worksheet whose headers aren't cached in one request
+        uncached = [
+            name for name in sheet_rows
+            if name not in self._headers and name not in self._pending_headers
+        ]
+        if uncached:
+            ranges = [f"{self._quote_sheet_name(name)}!1:1" for name in uncached]
+            value_ranges = self.spreadsheet.values_batch_get(ranges).get("valueRanges", [])
+            for name, value_range in zip(uncached, value_ranges):
+                self._headers[name] = (value_range.get("values") or [[]])[0]
+        
+        requests = []
+        new_headers: Dict[str, List[str]] = {}
+        for name, (header_row, rows) in sheet_rows.items():
+            sheet_id = worksheets[name].id
+            existing_headers = self._get_headers(name)
+            
+            if header_row and all(cell == "" for cell in existing_headers):
+                # Add header row if worksheet is empty or first row is blank
+                requests.extend(self._header_requests(sheet_id, header_row))
+                new_headers[name] = list(header_row)
+                if self.verbose:
+                    console.print(f"[cyan]📋 Added headers to {name}: {', '.join(header_row)}[/cyan]")
+            
+            if rows:
+                requests.append(self._append_request(sheet_id, rows))
+        
+        if requests and self._batch is not None:
+            self._batch.extend(requests)
+            self._pending_headers.update(new_headers)
+        elif requests:
+            self.spreadsheet.batch_update({"requests": requests})
+            self._headers.update(new_headers)
+            summary = ", ".join(f"{len(rows)} rows to {name}" for name, (_, rows) in sheet_rows.items())
+            console.print(f"[green]✅ Appended {summary} in one batch request[/green]")
+    
+    @contextmanager
+    def batch(self) -> Iterator["SheetsClient"]:
+        """
+        Queue writes made inside the block and send them in one spreadsheets.batchUpdate.
+        
+        append_rows, ensure_headers, batch_append, find_and_update_rows,
+        upsert_row and prepare_writer's writer queue their writes instead of
+        sending them. Reads still go
+        out immediately and do not see queued writes. Queued values are stored
+        as-is (like RAW input). If the block raises, nothing is sent, and
+        header rows queued in the block are not cached.
+        
+        Example:
+            with sheets_client.batch():
+                sheets_client.append_rows("Prospects", rows)
+                sheets_client.upsert_row("Companies", "id", company)
+        """
+        if self._batch is not None:
+            # Nested blocks join the outer batch
+            yield self
+            return
+        
+        self._batch = []
+        try:
+            yield self
+            requests, headers = self._batch, self._pending_headers
+        finally:
+            self._batch = None
+            self._pending_headers = {}
+        
+        if requests:
+            self.spreadsheet.batch_update({"requests": requests})
+            console.print(f"[green]✅ Sent {len(requests)} queued writes in one batch request[/green]")
+        # Queued header rows exist only now that the batch went through
+        self._headers.update(headers)
+    
+    @classmethod
+    def _header_requests(cls, sheet_id: int, header_row: List[str]) -> List[Dict[str, Any]]:
+        """Build batchUpdate requests that insert header_row above row 1."""
+        return [
+            {"insertDimension": {
+                "range": {"sheetId": sheet_id, "dimension": "ROWS", "startIndex": 0, "endIndex": 1},
+                "inheritFromBefore": False
+            }},
+            {"updateCells": {
+                "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0},
+                "rows": [cls._to_row_data(header_row)],
+                "fields": "userEnteredValue"
+            }}
+        ]
+    
+    @classmethod
+    def _append_request(cls, sheet_id: int, rows: List[List[Any]]) -> Dict[str, Any]:
+        """Build a batchUpdate appendCells request for rows."""
+        return {"appendCells": {
+            "sheetId": sheet_id,
+            "rows": [cls._to_row_data(row) for row in rows],
+            "fields": "userEnteredValue"
+        }}
+    
+    @staticmethod
+    def _quote_sheet_name(sheet_name: str) -> str:
+        """Quote a worksheet name for use in an A1 range."""
+        return "'" + sheet_name.replace("'", "''") + "'"
+    
+    @staticmethod
+    def _to_row_data(row: List[Any]) -> Dict[str, Any]:
+        """Convert a list of values to Sheets API RowData, stored as-is like RAW input."""
+        cells = []
+        for value in row:
+            if value is None:
+                cells.append({})
+            elif isinstance(value, bool):
+                cells.append({"userEnteredValue": {"boolValue": value}})
+            elif isinstance(value, (int, float)):
+                cells.append({"userEnteredValue": {"numberValue": value}})
+            else:
+                cells.append({"userEnteredValue": {"stringValue": str(value)}})
+        return {"values": cells}
+    
+    def bulk_write(self, sheet_name: str, values: List[List[Any]],
+                   chunk_rows: int = 5000, max_workers: int = 4) -> None:
+        """
+        Write a full 2D block of values starting at A1.
+        
+        The worksheet grid is resized once up front when it is too small, so the
+        write never triggers auto-resize round-trips. Blocks up to chunk_rows
+        rows go out in a single API call; larger blocks are split into
+        disjoint row ranges written concurrently (keep max_workers small, since
+        Sheets rate-limits per user).
+        
+        Args:
+            sheet_name: Name of the worksheet
+            values: List of rows (header row first)
+            chunk_rows: Maximum rows per update request
+            max_workers: Maximum concurrent update requests
+        """
+        if not values:
+            return
+        
+        worksheet = self.get_worksheet(sheet_name)
+        
+        # Row 1 is overwritten, so the cached header row is stale
+        self._headers.pop(sheet_name, None)
+        
+        num_rows = len(values)
+        num_cols = max(len(row) for row in values)
+        
+        # Pre-size the grid once so the update fits without extra requests
+        if worksheet.row_count < num_rows or worksheet.col_count < num_cols:
+            worksheet.resize(
+                rows=max(worksheet.row_count, num_rows),
+                cols=max(worksheet.col_count, num_cols)
+            )
+        
+        if num_rows <= chunk_rows:
+            range_name = f"A1:{rowcol_to_a1(num_rows, num_cols)}"
+            worksheet.update(values=values, range_name=range_name, value_input_option="RAW")
+            console.print(f"[green]✅ Wrote {num_rows} rows to {sheet_name} ({range_name})[/green]")
+            return
+        
+        def write_chunk(start: int) -> None:
+            rows = values[start:start + chunk_rows]
+            range_name = f"{rowcol_to_a1(start + 1, 1)}:{rowcol_to_a1(start + len(rows), num_cols)}"
+            worksheet.update(values=rows, range_name=range_name, value_input_option="RAW")
+        
+        starts = range(0, num_rows, chunk_rows)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(starts))) as executor:
+            # list() surfaces the first failed chunk as an exception
+            list(executor.map(write_chunk, starts))
+        
+        console.print(f"[green]✅ Wrote {num_rows} rows to {sheet_name} in {len(starts)} concurrent chunks[/green]")
+    
+    def write_table(self, sheet_name: str, header_row: List[str], rows: List[List[Any]]) -> None:
+        """
+        Replace a worksheet's contents with a header row and data rows.
+        
+        The whole table goes out through bulk_write first; only then are the
+        cells outside it (rows or columns left over from a larger previous
+        write) cleared in one request. If the write fails, the previous data is
+        still there instead of an emptied sheet.
+        
+        Args:
+            sheet_name: Name of the worksheet
+            header_row: Column names for row 1
+            rows: Data rows in header_row order
+        """
+        self.bulk_write(sheet_name, [list(header_row)] + rows)
+        self._headers[sheet_name] = list(header_row)
+        
+        worksheet = self.get_worksheet(sheet_name)
+        num_rows, num_cols = len(rows) + 1, len(header_row)
+        leftover = []
+        if worksheet.row_count > num_rows:
+            leftover.append(f"A{num_rows + 1}:{rowcol_to_a1(worksheet.row_count, worksheet.col_count)}")
+        if worksheet.col_count > num_cols:
+            leftover.append(f"{rowcol_to_a1(1, num_cols + 1)}:{rowcol_to_a1(num_rows, worksheet.col_count)}")
+        if leftover:
+            worksheet.batch_clear(leftover)
     
     def find_and_update_rows(self, sheet_name: str, key_column: str, 
                            key_value: str, update_data: Dict[str, Any]) -> bool:
@@ -168,28 +608,43 @@ class SheetsClient:
         worksheet = self.get_worksheet(sheet_name)
         
         try:
-            # Get all records to find the row
-            records = worksheet.get_all_records()
-            
-            # Find the row index (add 2 for header row and 0-indexing)
+            # Read only the key column to find the row (skipping the header cell)
+            header_row = self._get_headers(sheet_name)
             row_index = None
-            for idx, record in enumerate(records):
-                if str(record.get(key_column, "")) == str(key_value):
-                    row_index = idx + 2  # +2 for header and 1-indexing
-                    break
+            if key_column in header_row:
+                keys = worksheet.col_values(header_row.index(key_column) + 1)
+                try:
+                    row_index = keys.index(str(key_value), 1) + 1  # +1 for 1-indexing
+                except ValueError:
+                    pass
             
             if row_index:
-                # Update existing row
-                header_row = worksheet.row_values(1)
-                for col_name, value in update_data.items():
-                    if col_name in header_row:
-                        col_index = header_row.index(col_name) + 1  # 1-indexing
-                        worksheet.update_cell(row_index, col_index, value)
+                # Update existing row: all changed cells in one request
+                # 1-indexed column per header name; the first occurrence wins, like list.index
+                col_indexes = {name: idx + 1 for idx, name in reversed(list(enumerate(header_row)))}
+                cells = [
+                    gspread.Cell(row_index, col_indexes[col_name], value)
+                    for col_name, value in update_data.items()
+                    if col_name in col_indexes
+                ]
+                if cells and self._batch is not None:
+                    self._batch.extend(
+                        {"updateCells": {
+                            "start": {"sheetId": worksheet.id, "rowIndex": cell.row - 1, "columnIndex": cell.col - 1},
+                            "rows": [self._to_row_data([cell.value])],
+                            "fields": "userEnteredValue"
+                        }}
+                        for cell in cells
+                    )
+                elif cells:
+                    worksheet.update_cells(cells, value_input_option="USER_ENTERED")
                 
-                console.print(f"[yellow]🔄 Updated existing row in {sheet_name} where {key_column}={key_value}[/yellow]")
+                if self.verbose:
+                    console.print(f"[yellow]🔄 Updated existing row in {sheet_name} where {key_column}={key_value}[/yellow]")
                 return True
             else:
-                console.print(f"[blue]ℹ️ No existing row found in {sheet_name} where {key_column}={key_value}[/blue]")
+                if self.verbose:
+                    console.print(f"[blue]ℹ️ No existing row found in {sheet_name} where {key_column}={key_value}[/blue]")
                 return False
                 
         except Exception as e:
@@ -216,7 +671,7 @@ class SheetsClient:
         if not updated:
             # Insert new row
             worksheet = self.get_worksheet(sheet_name)
-            header_row = worksheet.row_values(1)
+            header_row = self._get_headers(sheet_name)
             
             # Create row in correct column order
             new_row = []
@@ -224,14 +679,132 @@ class SheetsClient:
                 new_row.append(row_data.get(header, ""))
             
             # If no headers exist, create them from row_data keys
-            if not header_row:
+            new_rows = [new_row]
+            new_header = not header_row
+            if new_header:
                 header_row = list(row_data.keys())
-                worksheet.append_row(header_row)
-                new_row = list(row_data.values())
+                new_rows = [header_row, list(row_data.values())]
             
-            worksheet.append_row(new_row)
-            console.print(f"[green]✅ Inserted new row in {sheet_name} with {key_column}={key_value}[/green]")
+            if self._batch is not None:
+                self._batch.append(self._append_request(worksheet.id, new_rows))
+                if new_header:
+                    self._pending_headers[sheet_name] = header_row
+            else:
+                for row in new_rows:
+                    worksheet.append_row(row)
+                if new_header:
+                    self._headers[sheet_name] = header_row
+            if self.verbose:
+                console.print(f"[green]✅ Inserted new row in {sheet_name} with {key_column}={key_value}[/green]")
     
+    def upsert_rows(self, sheet_name: str, key_column: str, rows: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Insert or update many rows based on a key column in a constant number of requests.
+        
+        The key column is read once with values.batchGet; matched rows are
+        updated in one values.batchUpdate (columns missing from a row dict are
+        left untouched) and new rows are added with one values.append.
+        
+        Args:
+            sheet_name: Name of the worksheet
+            key_column: Column name to use as the unique key
+            rows: Dictionaries of column:value pairs, one per row
+            
+        Returns:
+            Tuple of (rows updated, rows inserted)
+        """
+        worksheet = self.get_worksheet(sheet_name)
+        header_row = self._get_headers(sheet_name)
+        new_header = not header_row
+        if new_header:
+            # If no headers exist, create them from the row keys
+            header_row = list(dict.fromkeys(column for row in rows for column in row))
+        
+        # Map existing keys to 1-indexed sheet rows; the first match wins, like find_and_update_rows
+        existing: Dict[str, int] = {}
+        if not new_header and key_column in header_row:
+            key_letter = rowcol_to_a1(1, header_row.index(key_column) + 1)[:-1]
+            key_range = f"{self._quote_sheet_name(sheet_name)}!{key_letter}2:{key_letter}"
+            value_range = self.spreadsheet.values_batch_get([key_range])["valueRanges"][0]
+            for offset, cells in enumerate(value_range.get("values", [])):
+                if cells:
+                    existing.setdefault(str(cells[0]), offset + 2)  # +2 for header and 1-indexing
+        
+        last_col = rowcol_to_a1(1, len(header_row))[:-1]
+        updates: Dict[int, Dict[str, Any]] = {}
+        inserts: Dict[str, Dict[str, Any]] = {}
+        missing_keys = 0
+        for row_data in rows:
+            key_value = row_data.get(key_column)
+            if not key_value:
+                missing_keys += 1
+                continue
+            
+            row_index = existing.get(str(key_value))
+            if row_index:
+                updates.setdefault(row_index, {}).update(row_data)
+            else:
+                # Repeated new keys merge into one inserted row
+                inserts.setdefault(str(key_value), {}).update(row_data)
+        
+        if updates:
+            # None skips a cell, so columns absent from the row dict keep their values
+            self.spreadsheet.values_batch_update({
+                "valueInputOption": "USER_ENTERED",
+                "data": [
+                    {
+                        "range": f"{self._quote_sheet_name(sheet_name)}!A{row_index}:{last_col}{row_index}",
+                        "values": [[row_data.get(header) for header in header_row]]
+                    }
+                    for row_index, row_data in updates.items()
+                ]
+            })
+        
+        new_rows = [[row_data.get(header, "") for header in header_row] for row_data in inserts.values()]
+        if new_header and new_rows:
+            new_rows.insert(0, header_row)
+            self._headers[sheet_name] = header_row
+        if new_rows:
+            worksheet.append_rows(new_rows)
+        
+        if missing_keys:
+            console.print(f"[red]❌ Skipped {missing_keys} rows with no value for key column '{key_column}'[/red]")
+        console.print(
+            f"[green]✅ Upserted {len(updates)} updated and {len(inserts)} new rows in {sheet_name} "
+            f"by {key_column}[/green]"
+        )
+        return len(updates), len(inserts)
+
+    def upsert_many(self, upserts: Dict[str, Tuple[str, List[Dict[str, Any]]]],
+                    max_workers: int = 6) -> Dict[str, Tuple[int, int]]:
+        """
+        Run upsert_rows for several worksheets concurrently.
+
+        Each worksheet's upsert is a short chain of dependent round-trips, but
+        different worksheets don't depend on each other, so their chains overlap
+        on a small thread pool and the total wall time is close to the slowest
+        worksheet rather than the sum. Writes still go through the session's
+        rate-limited adapter, so the per-minute quota holds.
+
+        Args:
+            upserts: Mapping of worksheet name to (key_column, rows)
+            max_workers: Maximum worksheets upserted at the same time
+
+        Returns:
+            Mapping of worksheet name to (rows updated, rows inserted)
+        """
+        if not upserts:
+            return {}
+
+        def upsert(item: Tuple[str, Tuple[str, List[Dict[str, Any]]]]) -> Tuple[int, int]:
+            sheet_name, (key_column, rows) = item
+            return self.upsert_rows(sheet_name, key_column, rows)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(upserts))) as executor:
+            # list() surfaces the first failed worksheet as an exception
+            counts = list(executor.map(upsert, upserts.items()))
+        return dict(zip(upserts, counts))
+
     def read_cell(self, sheet_name: str, cell: str) -> str:
         """
         Read a specific cell value.
@@ -260,3 +833,66 @@ class SheetsClient:
             "worksheet_count": len(worksheets),
             "worksheets": [{"title": ws.title, "rows": ws.row_count, "cols": ws.col_count} for ws in worksheets]
         }
+
+    
+    def get_info_and_cells(self, ranges: List[str]) -> Dict[str, Any]:
+        """
+        Get spreadsheet information together with the values of specific cells.
+        
+        Metadata for all worksheets comes from one field-masked spreadsheets.get
+        and all requested cells from one values.batchGet, instead of a metadata
+        fetch plus a worksheet lookup and value read per cell.
+        
+        Args:
+            ranges: A1 ranges including the sheet name (e.g., 'Batches!A1')
+            
+        Returns:
+            Dictionary with spreadsheet information (as get_worksheet_info) and
+            a "cells" mapping of each requested range to its first value
+        """
+        metadata = self.spreadsheet.fetch_sheet_metadata(params={
+            "fields": "properties.title,sheets.properties(title,gridProperties(rowCount,columnCount))"
+        })
+        sheets = metadata.get("sheets", [])
+        
+        cells = {}
+        if ranges:
+            response = self.spreadsheet.values_batch_get(ranges)
+            for range_name, value_range in zip(ranges, response.get("valueRanges", [])):
+                values = value_range.get("values", [])
+                cells[range_name] = values[0][0] if values and values[0] else ""
+        
+        return {
+            "spreadsheet_id": self.sheets_id,
+            "title": metadata["properties"]["title"],
+            "worksheet_count": len(sheets),
+            "worksheets": [
+                {
+                    "title": sheet["properties"]["title"],
+                    "rows": sheet["properties"]["gridProperties"]["rowCount"],
+                    "cols": sheet["properties"]["gridProperties"]["columnCount"]
+                }
+                for sheet in sheets
+            ],
+            "cells": cells
+        }
+
+def create_sheets_client_from_config(config: Config) -> SheetsClient:
+    """
+    Factory function to create SheetsClient from a loaded Config.
+    
+    The service account credentials are taken from the config's cache, so
+    clients built from the same Config share one signer and access token.
+    
+    Returns:
+        Configured SheetsClient instance
+    """
+    sheets_config = config.get_google_sheets_config()
+    
+    return SheetsClient(
+        sheets_id=sheets_config["sheets_id"],
+        service_account_email=sheets_config["service_account_email"],
+        private_key=sheets_config["private_key"],
+        credentials_path=sheets_config.get("credentials_path", ""),
+        credentials=config.get_google_credentials()
+    )
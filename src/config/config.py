@@ -5,9 +5,22 @@ Loads settings from environment variables and canon.yaml
 
 import os
 import yaml
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from pathlib import Path
 from dotenv import load_dotenv
+from google.oauth2.service_account import Credentials
+
+# Prefer libyaml's C loader; fall back to the pure-Python loader
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# OAuth scopes required for Sheets and Drive access
+GOOGLE_SHEETS_SCOPES = [
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/drive'
+]
 
 class Config:
     """Configuration class that loads from environment variables and canon.yaml"""
@@ -15,9 +28,9 @@ class Config:
     def __init__(self):
         # Load environment variables from .env file
         load_dotenv()
-        # Load canon.yaml configuration
+        # canon.yaml configuration is parsed on first access
         self.canon_path = Path(__file__).parent.parent.parent / "config_canon.yaml"
-        self.canon_config = self._load_canon_config()
+        self._canon_config: Optional[Dict[str, Any]] = None
         
         # Google Sheets Configuration
         self.google_sheets_id = os.getenv("GOOGLE_SHEETS_ID", "")
@@ -31,13 +44,22 @@ class Config:
             self.google_sheets_id = ""
         if not self.google_service_account_email:
             self.google_service_account_email = ""
+        
+        # Service account credentials are parsed lazily and reused
+        self._google_credentials: Optional[Credentials] = None
+    
+    @property
+    def canon_config(self) -> Dict[str, Any]:
+        """canon.yaml configuration, loaded once per Config instance on first use"""
+        if self._canon_config is None:
+            self._canon_config = self._load_canon_config()
+        return self._canon_config
     
     def _load_canon_config(self) -> Dict[str, Any]:
         """Load configuration from canon.yaml"""
         try:
             if self.canon_path.exists():
-                with open(self.canon_path, 'r') as f:
-                    return yaml.safe_load(f) or {}
+                return yaml.load(self.canon_path.read_bytes(), Loader=YamlLoader) or {}
         except Exception:
             pass
         return {}
@@ -54,3 +76,49 @@ class Config:
     def get_worksheets_config(self) -> Dict[str, Any]:
         """Get worksheets configuration from canon"""
         return self.canon_config.get("google_sheets", {}).get("worksheets", {})
+    
+    def get_google_credentials(self) -> Credentials:
+        """
+        Get service account credentials for Google Sheets.
+        
+        The credentials are built once per Config instance so every client that
+        shares this config reuses the same signer and cached access token.
+        """
+        if self._google_credentials is None:
+            self._google_credentials = self.build_google_credentials(
+                self.google_service_account_email,
+                self.google_private_key,
+                self.google_credentials_path
+            )
+        return self._google_credentials
+    
+    @staticmethod
+    def build_google_credentials(service_account_email: str, private_key: str,
+                                 credentials_path: str = "") -> Credentials:
+        """Build service account credentials from a JSON key file or inline key pieces."""
+        # Prefer JSON credentials file if provided
+        if credentials_path:
+            return Credentials.from_service_account_file(credentials_path, scopes=GOOGLE_SHEETS_SCOPES)
+        
+        # Create service account credentials from provided pieces
+        service_account_info = {
+            "type": "service_account",
+            "private_key": Config.clean_private_key(private_key),
+            "client_email": service_account_email,
+            "token_uri": "https://oauth2.googleapis.com/token"
+        }
+        return Credentials.from_service_account_info(service_account_info, scopes=GOOGLE_SHEETS_SCOPES)
+    
+    @staticmethod
+    def clean_private_key(private_key: str) -> str:
+        """Normalize a PEM private key copied from .env (quotes, escaped newlines)."""
+        cleaned_private_key = private_key.strip()
+        # Strip surrounding quotes if present
+        if (cleaned_private_key.startswith('"') and cleaned_private_key.endswith('"')) or \
+           (cleaned_private_key.startswith("'") and cleaned_private_key.endswith("'")):
+            cleaned_private_key = cleaned_private_key[1:-1]
+        # Normalize Windows newlines and escaped sequences
+        cleaned_private_key = cleaned_private_key.replace('\r\n', '\n').replace('\r', '\n')
+        if '\\n' in cleaned_private_key:
+            cleaned_private_key = cleaned_private_key.replace('\\n', '\n')
+        return cleaned_private_key
@@ -3,11 +3,69 @@ Pydantic schemas for data validation in ColdOutreachPythonNoDB.
 These models validate external API data and ensure type safety throughout the application.
 """
 
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, validator, root_validator
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, field_validator
 from datetime import datetime
+import os
 import uuid
 import re
+import orjson
+
+
+# Email format accepted for prospects, compiled once at import
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+# Scheme and www. prefix stripped from company website URLs
+_DOMAIN_PREFIX_RE = re.compile(r'^(?:https?://)?(?:www\.)?')
+
+# Flattens line breaks in company descriptions in one str.translate pass
+_NEWLINES_TO_SPACES = str.maketrans({'\n': ' ', '\r': ' '})
+
+# Column order of the outreach template worksheet
+TEMPLATE_COLUMNS = (
+    "Full Name", "Last Name", "First Name", "Email", "Title",
+    "Personal LinkedIn", "Company Name", "Company Website",
+    "Company LinkedIn", "Personal Summary", "Company Background",
+    "Recent Company News", "Key Offerings", "Customer Sentiment",
+    "Company Summary", "Outreach Message"
+)
+
+
+class ProspectRow(NamedTuple):
+    """
+    Prospects worksheet row. A plain tuple in column order (no per-row dict),
+    so it can be sent to Sheets as-is while still allowing row.company_id access.
+    """
+    id: str
+    first_name: str
+    last_name: str
+    email: str
+    company_id: str
+    title: str
+    linkedin_url: str
+    phase: str
+    created_at: str
+    updated_at: str
+
+
+class CompanyRow(NamedTuple):
+    """
+    Companies worksheet row. A plain tuple in column order (no per-row dict),
+    so it can be sent to Sheets as-is while still allowing row.id access.
+    """
+    id: str
+    name: str
+    domain: str
+    industry: str
+    size: str
+    location: str
+    description: str
+    created_at: str
+
+
+# Column order of the normalized Prospects and Companies worksheets
+PROSPECT_COLUMNS = ProspectRow._fields
+COMPANY_COLUMNS = CompanyRow._fields
 
 
 class ApifyProspect(BaseModel):
@@ -40,9 +98,12 @@ class ApifyProspect(BaseModel):
     organization_linkedin_url: Optional[str] = Field(None, description="Company LinkedIn URL")
     organization_founded_year: Optional[int] = Field(None, description="Company founding year")
     organization_annual_revenue_printed: Optional[str] = Field(None, description="Company revenue")
+    organization_id: Optional[str] = Field(None, description="Apollo organization ID")
     
     # Internal processing fields
-    raw_data: Optional[Dict[str, Any]] = Field(None, description="Original raw data from Apify")
+    raw_data: Optional[Union[Dict[str, Any], bytes]] = Field(
+        None, description="Original raw data from Apify, as a dict or orjson-encoded bytes"
+    )
     
     # Computed properties for backward compatibility
     @property
@@ -54,10 +115,19 @@ class ApifyProspect(BaseModel):
     def company_domain(self) -> Optional[str]:
         """Extract domain from organization_website_url."""
         if self.organization_website_url:
-            domain = self.organization_website_url.replace('http://', '').replace('https://', '').replace('www.', '')
-            return domain.rstrip('/')
+            return _DOMAIN_PREFIX_RE.sub('', self.organization_website_url, count=1).rstrip('/')
         return None
     
+    @property
+    def company_key(self) -> Union[str, Tuple[str, str]]:
+        """
+        Key identifying this prospect's company: Apollo's organization_id when
+        the record has one, otherwise the normalized (name, domain) pair.
+        """
+        if self.organization_id:
+            return self.organization_id
+        return self.company_name.lower().strip(), (self.company_domain or "").lower()
+    
     @property
     def company_industry(self) -> Optional[str]:
         """Map industry to company_industry for compatibility."""
@@ -80,6 +150,13 @@ class ApifyProspect(BaseModel):
             parts.append(self.country)
         return ', '.join(parts) if parts else None
     
+    @property
+    def raw_fields(self) -> Dict[str, Any]:
+        """Original Apify record, decoding raw_data first if it is stored as bytes."""
+        if isinstance(self.raw_data, bytes):
+            return orjson.loads(self.raw_data)
+        return self.raw_data or {}
+    
     @property
     def effective_title(self) -> Optional[str]:
         """Use title if available, otherwise use headline."""
@@ -90,19 +167,25 @@ class ApifyProspect(BaseModel):
         """Combine first and last name."""
         return f"{self.first_name} {self.last_name}"
     
-    @validator('linkedin_url')
-    def validate_linkedin_url(cls, v):
+    @field_validator('linkedin_url')
+    @classmethod
+    def validate_linkedin_url(cls, v: Optional[str]) -> Optional[str]:
         """Ensure LinkedIn URL is properly formatted if provided."""
         if v and not v.startswith(('http://', 'https://')):
             return f"https://{v}"
         return v
     
+    @field_validator('organization_id', mode='before')
+    @classmethod
+    def validate_organization_id(cls, v: Any) -> Optional[str]:
+        """Accept numeric organization IDs by converting them to strings."""
+        return None if v is None else str(v)
     
-    @validator('email')
-    def validate_email(cls, v):
+    @field_validator('email')
+    @classmethod
+    def validate_email(cls, v: str) -> str:
         """Validate email format using regex."""
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, v):
+        if not _EMAIL_RE.fullmatch(v):
             raise ValueError('Invalid email format')
         return v.lower().strip()
     
@@ -111,39 +194,106 @@ class ApifyProspect(BaseModel):
         Convert ApifyProspect to normalized Prospects worksheet row format.
         Returns dict matching the prospects worksheet schema from canon.yaml.
         """
-        prospect_id = str(uuid.uuid4())
-        company_id = str(uuid.uuid4())  # Will be replaced with actual company lookup
-        
-        return {
-            "id": prospect_id,
-            "first_name": self.first_name,
-            "last_name": self.last_name,
-            "email": self.email,
-            "company_id": company_id,
-            "title": self.effective_title or "",
-            "linkedin_url": self.linkedin_url or "",
-            "phase": "discovered",  # Initial phase per canon requirements
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
-        }
+        # company_id will be replaced with actual company lookup
+        prospect_id, company_id = new_row_ids(2)
+        return dict(zip(PROSPECT_COLUMNS, self.to_prospect_tuple(
+            prospect_id, company_id, datetime.now().isoformat()
+        )))
     
     def to_company_row(self) -> Dict[str, Any]:
         """
         Convert ApifyProspect to normalized Companies worksheet row format.
         Returns dict matching the companies worksheet schema from canon.yaml.
         """
-        company_id = str(uuid.uuid4())
+        return dict(zip(COMPANY_COLUMNS, self.to_company_tuple(
+            new_row_ids(1)[0], datetime.now().isoformat()
+        )))
+    
+    def to_rows(self, prospect_id: Optional[str] = None, company_id: Optional[str] = None,
+                now: Optional[str] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Build the Prospects and Companies worksheet rows in one pass.
+        Both rows share one timestamp, and the prospect row already points at
+        the company row's ID. Batch callers can pass pre-generated IDs and a
+        batch timestamp (see new_row_ids).
+        """
+        if not (prospect_id and company_id):
+            fresh_prospect_id, fresh_company_id = new_row_ids(2)
+            prospect_id = prospect_id or fresh_prospect_id
+            company_id = company_id or fresh_company_id
+        now = now or datetime.now().isoformat()
+        
+        return (
+            dict(zip(PROSPECT_COLUMNS, self.to_prospect_tuple(prospect_id, company_id, now))),
+            dict(zip(COMPANY_COLUMNS, self.to_company_tuple(company_id, now)))
+        )
+    
+    @classmethod
+    def bulk_to_rows(cls, items: List["ApifyProspect"]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Build Prospects and Companies rows for many prospects at once.
+        All rows share one timestamp and every ID comes from a single
+        new_row_ids draw, instead of a clock read and uuid4 call per row.
+        Companies are deduplicated on company_key: one row per company, with
+        every prospect pointing at that row's ID.
+        """
+        now = datetime.now().isoformat()
+        row_ids = new_row_ids(2 * len(items))
+        company_registry: Dict[Union[str, Tuple[str, str]], str] = {}
         
-        return {
-            "id": company_id,
-            "name": self.company_name,
-            "domain": self.company_domain or "",
-            "industry": self.company_industry or "",
-            "size": self.company_size or "",
-            "location": self.location or "",
-            "description": "",  # Will be populated during research phase
-            "created_at": datetime.now().isoformat()
-        }
+        prospect_rows, company_rows = [], []
+        for i, prospect in enumerate(items):
+            company_id = company_registry.setdefault(prospect.company_key, row_ids[2 * i + 1])
+            if company_id == row_ids[2 * i + 1]:
+                company_rows.append(dict(zip(COMPANY_COLUMNS, prospect.to_company_tuple(company_id, now))))
+            prospect_rows.append(
+                dict(zip(PROSPECT_COLUMNS, prospect.to_prospect_tuple(row_ids[2 * i], company_id, now)))
+            )
+        return prospect_rows, company_rows
+    
+    def to_prospect_tuple(self, prospect_id: str, company_id: str, now: str) -> ProspectRow:
+        """
+        Build a Prospects worksheet row as values in PROSPECT_COLUMNS order.
+        Skips the intermediate dict for callers that write rows directly.
+        """
+        return ProspectRow(
+            prospect_id,
+            self.first_name,
+            self.last_name,
+            self.email,
+            company_id,
+            self.effective_title or "",
+            self.linkedin_url or "",
+            "discovered",  # Initial phase per canon requirements
+            now,
+            now
+        )
+    
+    def to_company_tuple(self, company_id: str, now: str) -> CompanyRow:
+        """
+        Build a Companies worksheet row as values in COMPANY_COLUMNS order.
+        Skips the intermediate dict for callers that write rows directly.
+        """
+        return CompanyRow(
+            company_id,
+            self.company_name,
+            self.company_domain or "",
+            self.company_industry or "",
+            self.company_size or "",
+            self.location or "",
+            "",  # Description will be populated during research phase
+            now
+        )
+    
+    @classmethod
+    def template_columns(cls) -> List[str]:
+        """Column names of the outreach template worksheet, in order."""
+        return list(TEMPLATE_COLUMNS)
+    
+    @classmethod
+    def bulk_to_template_rows(cls, items: List["ApifyProspect"]) -> List[List[Any]]:
+        """Convert many prospects to template rows in template_columns() order."""
+        return [prospect.to_template_values() for prospect in items]
     
     def to_template_row(self) -> Dict[str, Any]:
         """
@@ -154,73 +304,71 @@ class ApifyProspect(BaseModel):
         Company Background, Recent Company News, Key Offerings, 
         Customer Sentiment, Company Summary, Outreach Message
         """
-        # Get additional fields from raw_data if available
-        raw = self.raw_data or {}
-        
-        # Extract computed fields from Apollo data
-        full_name = f"{self.first_name} {self.last_name}"
-        personal_summary = self._extract_personal_summary()
-        company_background = self._extract_company_background()
-        key_offerings = self._extract_key_offerings()
-        company_summary = self._extract_company_summary()
+        return dict(zip(TEMPLATE_COLUMNS, self.to_template_values()))
+    
+    def to_template_values(self) -> List[Any]:
+        """
+        Convert ApifyProspect to a template worksheet row.
+        Values are returned in TEMPLATE_COLUMNS order so they can be written to
+        Google Sheets without an intermediate dict.
+        """
+        # Get additional fields from raw_data if available; decoded once per row
+        # and shared by the extractors below
+        raw = self.raw_fields
         
-        return {
-            "Full Name": full_name,
-            "Last Name": self.last_name,
-            "First Name": self.first_name,
-            "Email": self.email,
-            "Title": self.effective_title or "",
-            "Personal LinkedIn": self.linkedin_url or "",
-            "Company Name": self.company_name,
-            "Company Website": self.organization_website_url or "",
-            "Company LinkedIn": raw.get('organization_linkedin_url', ''),
-            "Personal Summary": personal_summary,
-            "Company Background": company_background,
-            "Recent Company News": "",  # To be populated during research phase
-            "Key Offerings": key_offerings,
-            "Customer Sentiment": "",  # To be populated during research phase
-            "Company Summary": company_summary,
-            "Outreach Message": ""  # To be populated during outreach phase
-        }
+        return [
+            f"{self.first_name} {self.last_name}",     # Full Name
+            self.last_name,                             # Last Name
+            self.first_name,                            # First Name
+            self.email,                                 # Email
+            self.effective_title or "",                 # Title
+            self.linkedin_url or "",                    # Personal LinkedIn
+            self.company_name,                          # Company Name
+            self.organization_website_url or "",        # Company Website
+            raw.get('organization_linkedin_url', ''),   # Company LinkedIn
+            self._extract_personal_summary(),           # Personal Summary
+            self._extract_company_background(raw),      # Company Background
+            "",                                         # Recent Company News (research phase)
+            self._extract_key_offerings(raw),           # Key Offerings
+            "",                                         # Customer Sentiment (research phase)
+            self._extract_company_summary(raw),         # Company Summary
+            ""                                          # Outreach Message (outreach phase)
+        ]
     
     def _extract_personal_summary(self) -> str:
         """Extract personal summary from headline and title."""
-        if hasattr(self, 'headline') and self.headline:
+        if self.headline:
             return self.headline[:200]  # Limit length
         elif self.effective_title:
             return f"{self.effective_title} at {self.company_name}"
         return ""
     
-    def _extract_company_background(self) -> str:
+    def _extract_company_background(self, raw: Dict[str, Any]) -> str:
         """Extract company background from organization description."""
-        raw = self.raw_data or {}
-        
         # Try organization_short_description first, then seo_description
         description = raw.get('organization_short_description') or raw.get('organization_seo_description', '')
         
         if description:
             # Clean and truncate description
-            clean_desc = description.replace('\n', ' ').replace('\r', ' ')
+            clean_desc = description.translate(_NEWLINES_TO_SPACES)
             return clean_desc[:500]  # Limit to 500 chars for sheets
         return ""
     
-    def _extract_key_offerings(self) -> str:
+    def _extract_key_offerings(self, raw: Dict[str, Any]) -> str:
         """Extract key offerings from keywords and industry."""
-        raw = self.raw_data or {}
         keywords = raw.get('keywords', '')
         
         if keywords:
-            # Extract first few keywords as key offerings
-            keyword_list = [k.strip() for k in keywords.split(',')][:5]
+            # Extract first few keywords as key offerings; stop splitting after the
+            # fifth comma instead of splitting and stripping the whole keyword list
+            keyword_list = [k.strip() for k in keywords.split(',', 5)[:5]]
             return ', '.join(keyword_list)
         elif self.industry:
             return f"{self.industry} solutions"
         return ""
     
-    def _extract_company_summary(self) -> str:
+    def _extract_company_summary(self, raw: Dict[str, Any]) -> str:
         """Extract company summary from various company fields."""
-        raw = self.raw_data or {}
-        
         # Build summary from available data
         summary_parts = []
         
@@ -241,11 +389,12 @@ class ApifyProspect(BaseModel):
         
         return ' | '.join(summary_parts)
     
-    class Config:
-        """Pydantic configuration."""
-        str_strip_whitespace = True  # Automatically strip whitespace
-        validate_assignment = True   # Validate on assignment
-        extra = "allow"             # Allow extra fields from Apollo to prevent rejection
+    # Pydantic configuration
+    model_config = ConfigDict(
+        str_strip_whitespace=True,  # Automatically strip whitespace
+        validate_assignment=True,   # Validate on assignment
+        extra="ignore"              # Drop unused Apollo fields instead of rejecting them or keeping a per-instance copy
+    )
 
 
 class ProspectNormalized(BaseModel):
@@ -278,3 +427,109 @@ class CompanyNormalized(BaseModel):
     location: str
     description: str
     created_at: str
+
+
+def new_row_ids(count: int) -> List[str]:
+    """
+    Generate ``count`` random UUID4 strings from a single os.urandom call.
+    
+    Args:
+        count: Number of IDs to generate
+        
+    Returns:
+        List of UUID4 strings, formatted like str(uuid.uuid4())
+    """
+    entropy = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=entropy[i:i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
+
+def to_prospect_row_from_dict(record: Dict[str, Any], prospect_id: Optional[str] = None,
+                              company_id: Optional[str] = None, now: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build a Prospects worksheet row straight from a trusted raw Apify record.
+    
+    Skips ApifyProspect construction entirely, so nothing is validated or
+    coerced: whitespace is not stripped, the email is only lowercased, and
+    LinkedIn URLs are not given a scheme. Matches ApifyProspect.to_rows only for
+    well-formed records; use it for data that has already been validated once.
+    
+    Args:
+        record: Raw Apify record
+        prospect_id: Row ID (generated when omitted)
+        company_id: Company row ID (generated when omitted)
+        now: ISO timestamp for created_at/updated_at (current time when omitted)
+        
+    Returns:
+        Dict matching the prospects worksheet schema
+    """
+    if not (prospect_id and company_id):
+        fresh_prospect_id, fresh_company_id = new_row_ids(2)
+        prospect_id = prospect_id or fresh_prospect_id
+        company_id = company_id or fresh_company_id
+    now = now or datetime.now().isoformat()
+    
+    return dict(zip(PROSPECT_COLUMNS, (
+        prospect_id,
+        record.get("first_name"),
+        record.get("last_name"),
+        (record.get("email") or "").lower(),
+        company_id,
+        record.get("title") or record.get("headline") or "",
+        record.get("linkedin_url") or "",
+        "discovered",
+        now,
+        now
+    )))
+
+
+# Validates a single prospect record; built once at import and reused by callers
+PROSPECT_ADAPTER = TypeAdapter(ApifyProspect)
+
+# Validates a whole list of prospects in a single pydantic-core call
+_PROSPECT_LIST_ADAPTER = TypeAdapter(List[ApifyProspect])
+
+
+def validate_prospect_batch(records: List[Dict[str, Any]]) -> Tuple[List[ApifyProspect], Dict[int, List[str]]]:
+    """
+    Validate a batch of raw records into ApifyProspect models in one pass.
+    
+    Invalid records do not abort the batch: their errors are collected and the
+    remaining records are validated again, still as a single batch.
+    
+    Args:
+        records: Raw record dictionaries
+        
+    Returns:
+        Tuple of (valid prospects in input order, {record index: error messages})
+    """
+    try:
+        return _PROSPECT_LIST_ADAPTER.validate_python(records), {}
+    except ValidationError as ve:
+        failures: Dict[int, List[str]] = {}
+        for err in ve.errors():
+            index = err["loc"][0]
+            field = " -> ".join(str(x) for x in err["loc"][1:])
+            failures.setdefault(index, []).append(f"{field}: {err['msg']}")
+        
+        remaining = [record for i, record in enumerate(records) if i not in failures]
+        return _PROSPECT_LIST_ADAPTER.validate_python(remaining), failures
+
+
+def validate_prospect_batch_json(payload: bytes) -> Tuple[List[ApifyProspect], Dict[int, List[str]]]:
+    """
+    Parse and validate a JSON array of raw records in one pydantic-core pass.
+    
+    No intermediate dicts are built when every record is valid. If any record
+    fails, the payload is decoded and handled by validate_prospect_batch so the
+    valid records are still returned.
+    
+    Args:
+        payload: JSON array of raw record objects
+        
+    Returns:
+        Tuple of (valid prospects in input order, {record index: error messages})
+    """
+    try:
+        return _PROSPECT_LIST_ADAPTER.validate_json(payload), {}
+    except ValidationError:
+        return validate_prospect_batch(orjson.loads(payload))
@@ -0,0 +1,300 @@
+"""
+Test script for SheetsClient batch operations against an in-memory spreadsheet.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from gspread.utils import a1_to_rowcol
+
+# src.clients.sheets_client (gspread, google-auth, requests) is imported inside
+# the functions that use it, so collecting or importing this module stays cheap
+
+class FakeWorksheet:
+    """Just enough of gspread.Worksheet, backed by a list of rows."""
+
+    def __init__(self, title: str, sheet_id: int, rows: Optional[List[List[Any]]] = None):
+        self.title = title
+        self.id = sheet_id
+        self.rows = [list(row) for row in rows or []]
+        self.calls: List[tuple] = []
+
+    def row_values(self, row: int) -> List[Any]:
+        self.calls.append(("row_values", row))
+        return list(self.rows[row - 1]) if len(self.rows) >= row else []
+
+    def col_values(self, col: int) -> List[Any]:
+        self.calls.append(("col_values", col))
+        return [row[col - 1] if len(row) >= col else "" for row in self.rows]
+
+    def append_rows(self, rows: List[List[Any]], **kwargs) -> None:
+        self.calls.append(("append_rows", rows))
+        self.rows.extend(list(row) for row in rows)
+
+    def append_row(self, row: List[Any], **kwargs) -> None:
+        self.calls.append(("append_row", row))
+        self.rows.append(list(row))
+
+    def insert_row(self, row: List[Any], index: int) -> None:
+        self.calls.append(("insert_row", row, index))
+        self.rows.insert(index - 1, list(row))
+
+class FakeSpreadsheet:
+    """Just enough of gspread.Spreadsheet; every request is recorded in ``calls``."""
+
+    def __init__(self, *worksheets: FakeWorksheet):
+        self.worksheets = {worksheet.title: worksheet for worksheet in worksheets}
+        self.calls: List[tuple] = []
+        self.fail_batch_update = False
+
+    def worksheet(self, title: str) -> FakeWorksheet:
+        return self.worksheets[title]
+
+    def _split_range(self, a1_range: str):
+        name, _, cells = a1_range.partition("!")
+        return self.worksheets[name.strip("'").replace("''", "'")], cells
+
+    def values_batch_get(self, ranges: List[str], params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        self.calls.append(("values_batch_get", ranges))
+        value_ranges = []
+        for a1_range in ranges:
+            worksheet, cells = self._split_range(a1_range)
+            if not cells:
+                values = worksheet.rows
+            elif cells == "1:1":
+                values = worksheet.rows[:1]
+            else:
+                # Single-column range such as C2:C
+                start, _ = cells.split(":")
+                first_row, col = a1_to_rowcol(start)
+                values = [row[col - 1:col] for row in worksheet.rows[first_row - 1:]]
+            value_range = {"range": a1_range}
+            if values:
+                value_range["values"] = [list(row) for row in values]
+            value_ranges.append(value_range)
+        return {"valueRanges": value_ranges}
+
+    def values_batch_update(self, body: Dict[str, Any]) -> None:
+        self.calls.append(("values_batch_update", body))
+        for data in body["data"]:
+            worksheet, cells = self._split_range(data["range"])
+            row = worksheet.rows[a1_to_rowcol(cells.split(":")[0])[0] - 1]
+            for col, value in enumerate(data["values"][0]):
+                if value is not None:
+                    row.extend([""] * (col + 1 - len(row)))
+                    row[col] = value
+
+    def batch_update(self, body: Dict[str, Any]) -> None:
+        self.calls.append(("batch_update", body))
+        if self.fail_batch_update:
+            raise RuntimeError("batch_update failed")
+
+def make_client(*worksheets: FakeWorksheet):
+    """SheetsClient wired to a FakeSpreadsheet, skipping authentication."""
+    from src.clients.sheets_client import SheetsClient
+
+    client = SheetsClient.__new__(SheetsClient)
+    client.sheets_id = "test"
+    client.verbose = False
+    client.spreadsheet = FakeSpreadsheet(*worksheets)
+    client._worksheets = {}
+    client._headers = {}
+    client._batch = None
+    client._pending_headers = {}
+    return client
+
+def test_upsert_rows():
+    """Matched keys are updated in place, new keys appended, keyless rows skipped."""
+    companies = FakeWorksheet("Companies", 1, [
+        ["id", "name", "domain"],
+        ["c1", "Acme", "acme.com"],
+        ["c2", "Globex", "globex.com"],
+        ["c1", "Acme (duplicate)", "acme.net"],
+    ])
+    client = make_client(companies)
+
+    print("🧪 Upserting rows by key column...")
+    updated, inserted = client.upsert_rows("Companies", "id", [
+        {"id": "c1", "name": "Acme Corp"},              # no domain: cell left as is
+        {"id": "c2", "name": None, "domain": "globex.io"},  # None: cell left as is
+        {"id": "c3", "name": "Initech", "domain": "initech.com"},
+        {"id": "c3", "domain": "initech.io"},           # repeated new key merges
+        {"name": "No key"},
+        {"id": "", "name": "Empty key"},
+    ])
+
+    assert (updated, inserted) == (2, 1)
+    assert companies.rows == [
+        ["id", "name", "domain"],
+        ["c1", "Acme Corp", "acme.com"],                # first duplicate wins
+        ["c2", "Globex", "globex.io"],
+        ["c1", "Acme (duplicate)", "acme.net"],
+        ["c3", "Initech", "initech.io"],
+    ]
+
+    # One key-column read, one values.batchUpdate, one append
+    assert client.spreadsheet.calls[0] == ("values_batch_get", ["'Companies'!A2:A"])
+    assert [call[0] for call in client.spreadsheet.calls] == ["values_batch_get", "values_batch_update"]
+    assert [call[0] for call in companies.calls] == ["row_values", "append_rows"]
+    print("✅ 2 rows updated, 1 inserted, 2 without a key skipped")
+
+def test_upsert_rows_empty_sheet():
+    """An empty worksheet gets a header row built from the row keys."""
+    sheet = FakeWorksheet("New", 2)
+    client = make_client(sheet)
+
+    print("🧪 Upserting into an empty worksheet...")
+    assert client.upsert_rows("New", "id", [{"id": "a", "x": 1}, {"id": "b", "y": 2}]) == (0, 2)
+    assert sheet.rows == [["id", "x", "y"], ["a", 1, ""], ["b", "", 2]]
+    assert client._headers["New"] == ["id", "x", "y"]
+    assert client.spreadsheet.calls == []
+    print("✅ Header row and 2 rows appended")
+
+def test_upsert_many():
+    """Each worksheet is upserted with its own key column; counts come back per worksheet."""
+    prospects = FakeWorksheet("Prospects", 1, [["email", "name"], ["a@x.com", "A"]])
+    companies = FakeWorksheet("Companies", 2, [["name", "id"], ["Acme", "c1"]])
+    client = make_client(prospects, companies)
+
+    print("🧪 Upserting two worksheets concurrently...")
+    counts = client.upsert_many({
+        "Prospects": ("email", [{"email": "a@x.com", "name": "Alice"}, {"email": "b@x.com", "name": "Bob"}]),
+        "Companies": ("id", [{"id": "c1", "name": "Acme Corp"}]),
+    }, max_workers=2)
+
+    assert counts == {"Prospects": (1, 1), "Companies": (1, 0)}
+    assert prospects.rows == [["email", "name"], ["a@x.com", "Alice"], ["b@x.com", "Bob"]]
+    assert companies.rows == [["name", "id"], ["Acme Corp", "c1"]]
+    assert client.upsert_many({}) == {}
+    print("✅ Per-worksheet counts returned")
+
+def test_prepare_writer():
+    """Rows follow the sheet's column order; columns a dict lacks are written as ""."""
+    sheet = FakeWorksheet("Prospects", 1, [["name", "email", "notes"]])  # notes added by hand
+    client = make_client(sheet)
+
+    print("🧪 Writing dict rows through prepare_writer...")
+    writer = client.prepare_writer("Prospects", ["email", "name"], batch_size=2)
+    written = writer([
+        {"email": "a@x.com", "name": "A", "notes": "vip"},
+        {"email": "b@x.com", "name": "B"},
+        {"email": "c@x.com", "name": "C", "notes": ""},
+    ])
+
+    assert written == 3
+    assert [call for call in sheet.calls if call[0] == "append_rows"] == [
+        ("append_rows", [["A", "a@x.com", "vip"], ["B", "b@x.com", ""]]),
+        ("append_rows", [["C", "c@x.com", ""]]),
+    ]
+    print("✅ 3 rows written in 2 appends, missing column filled with \"\"")
+
+def test_prepare_writer_single_column():
+    """An empty worksheet gets the header row; one-column rows are still lists."""
+    sheet = FakeWorksheet("Emails", 1)
+    client = make_client(sheet)
+
+    print("🧪 Writing single-column rows into an empty worksheet...")
+    writer = client.prepare_writer("Emails", ["email"])
+    assert writer([{"email": "a@x.com"}, {}]) == 2
+    assert sheet.rows == [["email"], ["a@x.com"], [""]]
+    print("✅ Header row inserted and 2 rows written")
+
+def test_batch_get_records():
+    """Several worksheets are read with one request; short rows are padded."""
+    prospects = FakeWorksheet("Prospects", 1, [["email", "name"], ["a@x.com", "A"], ["b@x.com"]])
+    empty = FakeWorksheet("Bob's Sheet", 2)
+    client = make_client(prospects, empty)
+
+    print("🧪 Reading two worksheets in one batch request...")
+    records = client.batch_get_records(["Prospects", "Bob's Sheet"])
+
+    assert records == {
+        "Prospects": [{"email": "a@x.com", "name": "A"}, {"email": "b@x.com", "name": ""}],
+        "Bob's Sheet": [],
+    }
+    assert client.spreadsheet.calls == [("values_batch_get", ["'Prospects'", "'Bob''s Sheet'"])]
+    assert client._headers == {"Prospects": ["email", "name"], "Bob's Sheet": []}
+    assert client.batch_get_records([]) == {}
+    print("✅ Records read and header rows cached")
+
+def test_batch():
+    """Writes inside batch(), including nested blocks, go out in one batch_update."""
+    prospects = FakeWorksheet("Prospects", 1)
+    companies = FakeWorksheet("Companies", 2, [["id", "name"], ["c1", "Acme"]])
+    client = make_client(prospects, companies)
+
+    print("🧪 Queueing writes in a batch() block...")
+    with client.batch():
+        client.append_rows("Prospects", [["a@x.com", "A"]], header_row=["email", "name"])
+        with client.batch():
+            client.upsert_row("Companies", "id", {"id": "c2", "name": "Globex"})
+        writer = client.prepare_writer("Prospects", ["email", "name"])
+        writer([{"name": "B", "email": "b@x.com"}])
+
+        # Nothing sent yet, and the queued header row is not cached
+        assert not any(call[0] == "batch_update" for call in client.spreadsheet.calls)
+        assert client._headers["Prospects"] == []
+
+    batch_updates = [call[1] for call in client.spreadsheet.calls if call[0] == "batch_update"]
+    assert len(batch_updates) == 1
+    requests = batch_updates[0]["requests"]
+    assert [next(iter(request)) for request in requests] == [
+        "insertDimension", "updateCells", "appendCells", "appendCells", "appendCells"
+    ]
+    assert requests[1]["updateCells"]["start"]["sheetId"] == 1
+    assert [request["appendCells"]["sheetId"] for request in requests[2:]] == [1, 2, 1]
+    assert requests[4]["appendCells"]["rows"] == [
+        {"values": [{"userEnteredValue": {"stringValue": "b@x.com"}},
+                    {"userEnteredValue": {"stringValue": "B"}}]}
+    ]
+
+    # Writes went through the batch only; the header row is cached once it was sent
+    assert not any(call[0] in ("insert_row", "append_row", "append_rows")
+                   for call in prospects.calls + companies.calls)
+    assert client._headers["Prospects"] == ["email", "name"]
+    assert client._batch is None and client._pending_headers == {}
+    print(f"✅ {len(requests)} requests sent in one batch_update")
+
+def test_batch_discarded():
+    """A block that raises, or a failed batch_update, leaves the header cache unchanged."""
+    client = make_client(FakeWorksheet("Prospects", 1))
+
+    print("🧪 Raising inside a batch() block...")
+    try:
+        with client.batch():
+            client.append_rows("Prospects", [["a@x.com"]], header_row=["email"])
+            raise ValueError("abort")
+    except ValueError:
+        pass
+    assert client.spreadsheet.calls == []
+    assert client._batch is None and client._pending_headers == {}
+    assert client._headers == {"Prospects": []}
+
+    print("🧪 Failing the batch_update...")
+    client.spreadsheet.fail_batch_update = True
+    try:
+        with client.batch():
+            client.append_rows("Prospects", [["a@x.com"]], header_row=["email"])
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("batch_update error was swallowed")
+    assert len(client.spreadsheet.calls) == 1
+    assert client._batch is None and client._pending_headers == {}
+    assert client._headers == {"Prospects": []}
+
+    # Headers are checked again, not assumed, on the next write
+    client.spreadsheet.fail_batch_update = False
+    with client.batch():
+        client.append_rows("Prospects", [["a@x.com"]], header_row=["email"])
+    assert next(iter(client.spreadsheet.calls[-1][1]["requests"][0])) == "insertDimension"
+    print("✅ Queue and pending headers dropped on failure")
+
+if __name__ == "__main__":
+    test_upsert_rows()
+    test_upsert_rows_empty_sheet()
+    test_upsert_many()
+    test_prepare_writer()
+    test_prepare_writer_single_column()
+    test_batch_get_records()
+    test_batch()
+    test_batch_discarded()